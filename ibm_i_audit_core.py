@@ -8,17 +8,640 @@ of the IBM i Perl audit tools (system_i_audit) to Python for use
 in Streamlit applications.
 """
 
+import copy
 import json
+from types import MappingProxyType
+from enum import IntEnum
+from functools import cached_property
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Any
 import logging
+import sys
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class ObjectAuthority(NamedTuple):
+    """Authority of one user (or *PUBLIC) on one IBM i object"""
+    obj_auth: str = ''
+    obj_type: str = 'Unknown'
+    obj_owner: str = ''
+    risk_level: str = 'Low'
+    compliance_frameworks: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ObjectAuthority':
+        """Build a record from its JSON dict form, ignoring unknown keys"""
+        record = cls(**{k: v for k, v in data.items() if k in cls._fields})
+        return record._replace(compliance_frameworks=tuple(record.compliance_frameworks))
+
+# Shape of a system value entry; loaded entries are filled out to this schema
+_SYSTEM_VALUE_DEFAULTS = {
+    'current': 'Unknown',
+    'recommended': 'Unknown',
+    'description': 'Unknown',
+    'exception': False,
+    'compliance_frameworks': [],
+    'business_impact': 'Unknown',
+    'remediation_effort': 'Unknown',
+    'ibm_redbook_ref': ''
+}
+
+def _load_system_value(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a system value entry with every schema field present"""
+    system_value = {**_SYSTEM_VALUE_DEFAULTS, **data}
+    system_value['compliance_frameworks'] = list(system_value['compliance_frameworks'])
+    return system_value
+
+# System values read by the compliance controls, with the setting assumed when absent
+_REQUIRED_SYSTEM_VALUES = {
+    'QPWDEXPITV': '0',
+    'QPWDCHGCYC': '0',
+    'QPWDVLDPGM': '*NONE',
+    'QINACTMSGQ': '*NONE',
+    'QSECURITY': '0',
+    'QMAXSIGN': '10'
+}
+
+def _parse_system_value_ints(current_values: Dict[str, Any]) -> Dict[str, int]:
+    """Integer form of every system value whose current setting is numeric"""
+    parsed = {}
+    for name, current in current_values.items():
+        try:
+            parsed[name] = int(current)
+        except (TypeError, ValueError):
+            pass
+    return parsed
+
+def _build_mock_template(base_date: datetime) -> Dict[str, Dict[str, Any]]:
+    """Build the static mock IBM i data set with dates relative to base_date"""
+    
+    # Enhanced Mock System Values based on IBM Redbooks
+    system_values = {
+        # Security Level and Access Control
+        'QSECURITY': {
+            'current': '40',
+            'recommended': '40',
+            'description': 'System security level (10=Basic, 20=Standard, 30=Enhanced, 40=Maximum)',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001', 'NIST'],
+            'business_impact': 'High',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        
+        # Password Management
+        'QPWDEXPITV': {
+            'current': '90',
+            'recommended': '90',
+            'description': 'Password expiration interval in days',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001', 'NIST'],
+            'business_impact': 'Medium',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QPWDLVL': {
+            'current': '2',
+            'recommended': '2',
+            'description': 'Password level (0=Basic, 1=Enhanced, 2=Maximum)',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
+            'business_impact': 'Medium',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QPWDMINLEN': {
+            'current': '8',
+            'recommended': '8',
+            'description': 'Minimum password length',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001'],
+            'business_impact': 'Medium',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QPWDMAXLEN': {
+            'current': '128',
+            'recommended': '128',
+            'description': 'Maximum password length',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS'],
+            'business_impact': 'Low',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QPWDRQDDIF': {
+            'current': '5',
+            'recommended': '5',
+            'description': 'Number of different characters required in new password',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
+            'business_impact': 'Medium',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QPWDVLDPGM': {
+            'current': '*NONE',
+            'recommended': 'CUSTPWD',
+            'description': 'Password validation program name',
+            'exception': True,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
+            'business_impact': 'High',
+            'remediation_effort': 'Medium',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        
+        # Sign-on and Session Management
+        'QMAXSIGN': {
+            'current': '5',
+            'recommended': '5',
+            'description': 'Maximum sign-on attempts before account lockout',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001'],
+            'business_impact': 'High',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QMAXSGNACN': {
+            'current': '10',
+            'recommended': '10',
+            'description': 'Action when maximum sign-on attempts exceeded (*DISABLE, *ENDJOB, *ENDJOBSBS)',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
+            'business_impact': 'High',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QINACTITV': {
+            'current': '30',
+            'recommended': '30',
+            'description': 'Inactivity timeout in minutes before automatic sign-off',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001'],
+            'business_impact': 'Medium',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QINACTMSGQ': {
+            'current': '*NONE',
+            'recommended': 'INACTMSGQ',
+            'description': 'Inactive message queue for timeout notifications',
+            'exception': True,
+            'compliance_frameworks': ['SOX', 'PCI DSS'],
+            'business_impact': 'Low',
+            'remediation_effort': 'Medium',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        
+        # Audit and Journaling
+        'QAUDCTL': {
+            'current': '*AUDLVL',
+            'recommended': '*AUDLVL',
+            'description': 'Audit control (*NONE, *AUDLVL, *AUTFAIL, *AUTFAIL, *AUTFAIL)',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001', 'NIST'],
+            'business_impact': 'High',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QAUDLVL': {
+            'current': '*SECURITY',
+            'recommended': '*SECURITY',
+            'description': 'Audit level (*NONE, *SECURITY, *SECURITY, *SECURITY, *SECURITY)',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001', 'NIST'],
+            'business_impact': 'High',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QAUDLVL2': {
+            'current': '*NONE',
+            'recommended': '*SECURITY',
+            'description': 'Secondary audit level for additional events',
+            'exception': True,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
+            'business_impact': 'Medium',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QAUDJRN': {
+            'current': 'QSYS/AUDIT_JRN',
+            'recommended': 'QSYS/AUDIT_JRN',
+            'description': 'Audit journal name and library',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001', 'NIST'],
+            'business_impact': 'High',
+            'remediation_effort': 'Medium',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QAUDJRNRCV': {
+            'current': 'QSYS/AUDIT_JRN',
+            'recommended': 'QSYS/AUDIT_JRN',
+            'description': 'Audit journal receiver name and library',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
+            'business_impact': 'Medium',
+            'remediation_effort': 'Medium',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        
+        # Network and Remote Access
+        'QRMTSIGN': {
+            'current': '*NONE',
+            'recommended': '*NONE',
+            'description': 'Remote sign-on control (*NONE, *SIGNON, *SIGNON, *SIGNON)',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001'],
+            'business_impact': 'High',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QLMTSECOFR': {
+            'current': '*YES',
+            'recommended': '*NO',
+            'description': 'Limit QSECOFR to console (*YES, *NO)',
+            'exception': True,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
+            'business_impact': 'High',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QLMTDEVSSN': {
+            'current': '*YES',
+            'recommended': '*YES',
+            'description': 'Limit device sessions (*YES, *NO)',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS'],
+            'business_impact': 'Medium',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        
+        # System Access Control
+        'QALWOBJRST': {
+            'current': '*NONE',
+            'recommended': '*NONE',
+            'description': 'Allow object restore (*NONE, *ALL, *AUTL, *AUTL)',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
+            'business_impact': 'High',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QALWOBJRSTDTA': {
+            'current': '*NONE',
+            'recommended': '*NONE',
+            'description': 'Allow object restore with data (*NONE, *ALL, *AUTL)',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
+            'business_impact': 'High',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QALWUSRDMN': {
+            'current': '*NONE',
+            'recommended': '*NONE',
+            'description': 'Allow user domain (*NONE, *ALL, *AUTL)',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS'],
+            'business_impact': 'Medium',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        
+        # Library List Security
+        'QLIBLACN': {
+            'current': '*NONE',
+            'recommended': '*NONE',
+            'description': 'Library list action (*NONE, *CHGLIBL, *CHGLIBL)',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS'],
+            'business_impact': 'Medium',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        },
+        'QSPLACN': {
+            'current': '*NONE',
+            'recommended': '*NONE',
+            'description': 'Spooled file action (*NONE, *CHGSPLFA, *CHGSPLFA)',
+            'exception': False,
+            'compliance_frameworks': ['SOX', 'PCI DSS'],
+            'business_impact': 'Low',
+            'remediation_effort': 'Low',
+            'ibm_redbook_ref': 'SG24-8150'
+        }
+    }
+    
+    # Enhanced Mock User Profiles with Enterprise Scenarios
+    user_profiles = {
+        'QSECOFR': {
+            'name': 'Security Officer',
+            'status': '*ENABLED',
+            'group': 'QSECOFR',
+            'pass_none': '*NO',
+            'spec_auth': ['*ALLOBJ', '*SECADM'],
+            'prev_sign_on': (base_date - timedelta(days=1)).strftime('%Y-%m-%d'),
+            'user_class': '*SECOFR',
+            'pass_exp': '*YES',
+            'job_title': 'Security Administrator',
+            'department': 'IT Security',
+            'last_password_change': (base_date - timedelta(days=15)).strftime('%Y-%m-%d'),
+            'failed_login_attempts': 0,
+            'compliance_status': 'Compliant'
+        },
+        'JOHNDOE': {
+            'name': 'John Doe',
+            'status': '*ENABLED',
+            'group': 'USERS',
+            'pass_none': '*YES',  # Security issue
+            'spec_auth': [],
+            'prev_sign_on': (base_date - timedelta(days=30)).strftime('%Y-%m-%d'),
+            'user_class': '*USER',
+            'pass_exp': '*NO',
+            'job_title': 'Application Developer',
+            'department': 'Development',
+            'last_password_change': (base_date - timedelta(days=120)).strftime('%Y-%m-%d'),
+            'failed_login_attempts': 2,
+            'compliance_status': 'Non-Compliant'
+        },
+        'JANESMITH': {
+            'name': 'Jane Smith',
+            'status': '*DISABLED',  # Security issue
+            'group': 'USERS',
+            'pass_none': '*NO',
+            'spec_auth': [],
+            'prev_sign_on': (base_date - timedelta(days=45)).strftime('%Y-%m-%d'),
+            'user_class': '*USER',
+            'pass_exp': '*YES',
+            'job_title': 'Business Analyst',
+            'department': 'Finance',
+            'last_password_change': (base_date - timedelta(days=60)).strftime('%Y-%m-%d'),
+            'failed_login_attempts': 0,
+            'compliance_status': 'Non-Compliant'
+        },
+        'ADMIN': {
+            'name': 'System Administrator',
+            'status': '*ENABLED',
+            'group': 'ADMIN',
+            'pass_none': '*NO',
+            'spec_auth': ['*ALLOBJ', '*IOSYSCFG'],
+            'prev_sign_on': (base_date - timedelta(days=2)).strftime('%Y-%m-%d'),
+            'user_class': '*SECOFR',
+            'pass_exp': '*YES',
+            'job_title': 'System Administrator',
+            'department': 'IT Operations',
+            'last_password_change': (base_date - timedelta(days=30)).strftime('%Y-%m-%d'),
+            'failed_login_attempts': 0,
+            'compliance_status': 'Compliant'
+        },
+        'GUEST': {
+            'name': 'Guest User',
+            'status': '*ENABLED',
+            'group': 'GUEST',
+            'pass_none': '*YES',  # Security issue
+            'spec_auth': [],
+            'prev_sign_on': (base_date - timedelta(days=5)).strftime('%Y-%m-%d'),
+            'user_class': '*USER',
+            'pass_exp': '*NO',
+            'job_title': 'Guest Access',
+            'department': 'External',
+            'last_password_change': (base_date - timedelta(days=365)).strftime('%Y-%m-%d'),
+            'failed_login_attempts': 0,
+            'compliance_status': 'Non-Compliant'
+        }
+    }
+    
+    # Enhanced Mock Groups with Enterprise Structure
+    groups = {
+        'QSECOFR': {
+            'name': 'Security Officers',
+            'members': ['QSECOFR'],
+            'status': '*ENABLED',
+            'description': 'System security administrators',
+            'created_date': (base_date - timedelta(days=365)).strftime('%Y-%m-%d'),
+            'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA']
+        },
+        'ADMIN': {
+            'name': 'System Administrators',
+            'members': ['ADMIN'],
+            'status': '*ENABLED',
+            'description': 'System administration team',
+            'created_date': (base_date - timedelta(days=300)).strftime('%Y-%m-%d'),
+            'compliance_frameworks': ['SOX', 'PCI DSS']
+        },
+        'USERS': {
+            'name': 'General Users',
+            'members': ['JOHNDOE', 'JANESMITH'],
+            'status': '*ENABLED',
+            'description': 'Standard business users',
+            'created_date': (base_date - timedelta(days=200)).strftime('%Y-%m-%d'),
+            'compliance_frameworks': ['SOX']
+        },
+        'GUEST': {
+            'name': 'Guest Access',
+            'members': ['GUEST'],
+            'status': '*ENABLED',
+            'description': 'Temporary guest access',
+            'created_date': (base_date - timedelta(days=50)).strftime('%Y-%m-%d'),
+            'compliance_frameworks': []
+        },
+        'DEVELOPERS': {
+            'name': 'Development Team',
+            'members': ['JOHNDOE'],
+            'status': '*ENABLED',
+            'description': 'Application development team',
+            'created_date': (base_date - timedelta(days=150)).strftime('%Y-%m-%d'),
+            'compliance_frameworks': ['SOX']
+        }
+    }
+    
+    # Enhanced Mock Object Authorities with Enterprise Scenarios
+    object_authorities = {
+        'QSYS/QCMD': {
+            '*PUBLIC': ObjectAuthority(
+                obj_auth='*EXCLUDE',
+                obj_type='*CMD',
+                obj_owner='QSYS',
+                risk_level='Low',
+                compliance_frameworks=('SOX', 'PCI DSS')
+            ),
+            'QSECOFR': ObjectAuthority(
+                obj_auth='*ALL',
+                obj_type='*CMD',
+                obj_owner='QSYS',
+                risk_level='High',
+                compliance_frameworks=('SOX', 'PCI DSS')
+            ),
+            'ADMIN': ObjectAuthority(
+                obj_auth='*USE',
+                obj_type='*CMD',
+                obj_owner='QSYS',
+                risk_level='Medium',
+                compliance_frameworks=('SOX',)
+            )
+        },
+        'PRODLIB/CUSTOMER': {
+            '*PUBLIC': ObjectAuthority(
+                obj_auth='*EXCLUDE',
+                obj_type='*FILE',
+                obj_owner='QSECOFR',
+                risk_level='Low',
+                compliance_frameworks=('SOX', 'PCI DSS', 'HIPAA')
+            ),
+            'JOHNDOE': ObjectAuthority(
+                obj_auth='*CHANGE',
+                obj_type='*FILE',
+                obj_owner='QSECOFR',
+                risk_level='Medium',
+                compliance_frameworks=('SOX', 'PCI DSS')
+            )
+        },
+        'FINLIB/PAYROLL': {
+            '*PUBLIC': ObjectAuthority(
+                obj_auth='*EXCLUDE',
+                obj_type='*FILE',
+                obj_owner='QSECOFR',
+                risk_level='Low',
+                compliance_frameworks=('SOX', 'PCI DSS', 'HIPAA')
+            ),
+            'JANESMITH': ObjectAuthority(
+                obj_auth='*READ',
+                obj_type='*FILE',
+                obj_owner='QSECOFR',
+                risk_level='Low',
+                compliance_frameworks=('SOX', 'PCI DSS')
+            )
+        },
+        'QSYS/QSYSOPR': {
+            '*PUBLIC': ObjectAuthority(
+                obj_auth='*EXCLUDE',
+                obj_type='*MSGQ',
+                obj_owner='QSYS',
+                risk_level='Low',
+                compliance_frameworks=('SOX',)
+            ),
+            'QSECOFR': ObjectAuthority(
+                obj_auth='*ALL',
+                obj_type='*MSGQ',
+                obj_owner='QSYS',
+                risk_level='High',
+                compliance_frameworks=('SOX',)
+            )
+        }
+    }
+    
+    return {
+        'system_values': system_values,
+        'user_profiles': user_profiles,
+        'groups': groups,
+        'object_authorities': object_authorities
+    }
+
+# Ordered category sets for the low-cardinality columns of the analysis DataFrames
+_RISK_LEVELS = ['Low', 'Medium', 'High']
+_COMPLIANCE_STATUSES = ['Non-Compliant', 'Compliant']
+
+# Score thresholds for Medium (>= 20) and High (>= 40) risk, for bulk scoring
+_RISK_BREAKS = np.array([20, 40])
+
+def _risk_levels_from_scores(scores: List[int]) -> pd.Categorical:
+    """Map a batch of risk scores to Low/Medium/High labels.
+
+    The bucket index is already the category code, so the labels are built
+    straight from codes without creating or comparing any strings.
+    """
+    codes = np.searchsorted(_RISK_BREAKS, scores, side='right')
+    return pd.Categorical.from_codes(codes, categories=_RISK_LEVELS, ordered=True)
+
+def _categorize_results(df: pd.DataFrame) -> pd.DataFrame:
+    """Store risk_level/compliance_status columns as ordered categoricals"""
+    if 'risk_level' in df.columns:
+        df['risk_level'] = pd.Categorical(df['risk_level'], categories=_RISK_LEVELS, ordered=True)
+    if 'compliance_status' in df.columns:
+        df['compliance_status'] = pd.Categorical(df['compliance_status'], categories=_COMPLIANCE_STATUSES, ordered=True)
+    return df
+
+# Empty analysis frames returned by run_full_audit when an analysis fails;
+# built once and shared, callers only read them
+_EMPTY_AUDIT_RESULTS = MappingProxyType({
+    'object_authorities': pd.DataFrame(columns=['object', 'user', 'object_type', 'security_issues', 'risk_level']),
+    'user_profiles': pd.DataFrame(columns=['user_id', 'name', 'status', 'group', 'special_authorities', 'security_issues', 'risk_level']),
+    'system_values': pd.DataFrame(columns=['system_value', 'current_value', 'recommended_value', 'description', 'compliance_status', 'risk_level'])
+})
+
+# get_audit_summary's result when there are no (usable) audit results
+_EMPTY_SUMMARY = MappingProxyType({
+    'total_issues': 0,
+    'high_risk_issues': 0,
+    'medium_risk_issues': 0,
+    'low_risk_issues': 0,
+    'compliance_score': 100,
+    'total_objects_analyzed': 0,
+    'total_users_analyzed': 0,
+    'total_system_values': 0,
+    'categories': None  # Filled with a fresh dict by _empty_summary
+})
+
+def _empty_summary() -> Dict[str, Any]:
+    """A fresh copy of _EMPTY_SUMMARY, with its own categories dict"""
+    # copy() on the proxy is a plain dict copy of the template
+    summary = _EMPTY_SUMMARY.copy()
+    summary['categories'] = {}
+    return summary
+
+# IBM i special values that recur across system values, profiles and authorities
+_KNOWN_SPECIAL_VALUES = frozenset({
+    '*NONE', '*YES', '*NO', '*ENABLED', '*DISABLED', '*ALL', '*USE', '*CHANGE',
+    '*READ', '*EXCLUDE', '*PUBLIC', '*ALLOBJ', '*SECADM', '*IOSYSCFG', '*SECOFR', '*USER'
+})
+
+# Interned constants for the values compared in the per-profile and
+# per-authority loops; loaded data is interned by _intern_known, so the
+# comparisons usually succeed on identity
+_YES = sys.intern('*YES')
+_DISABLED = sys.intern('*DISABLED')
+_ENABLED = sys.intern('*ENABLED')
+_ALLOBJ = sys.intern('*ALLOBJ')
+_ALL = sys.intern('*ALL')
+_NONE = sys.intern('*NONE')
+_QSECOFR = sys.intern('QSECOFR')
+
+# Users whose *ALL grants count against privileged access controls
+_PRIVILEGED_USERS = frozenset({_QSECOFR})
+
+# int8 codes for the profile status column; any other status is 0
+_STATUS_ENABLED = np.int8(1)
+_STATUS_DISABLED = np.int8(2)
+_STATUS_CODES = {_ENABLED: _STATUS_ENABLED, _DISABLED: _STATUS_DISABLED}
+
+def _intern_known(value: Any) -> Any:
+    """Recursively replace known special values with interned strings"""
+    if isinstance(value, str):
+        return sys.intern(value) if value in _KNOWN_SPECIAL_VALUES else value
+    if isinstance(value, dict):
+        for key, item in value.items():
+            value[key] = _intern_known(item)
+    elif isinstance(value, list):
+        value[:] = [_intern_known(item) for item in value]
+    elif isinstance(value, ObjectAuthority):
+        return value._make(_intern_known(item) for item in value)
+    return value
+
+# Mock data template, built once at import and copied into each data manager
+_MOCK_TEMPLATE = _intern_known(_build_mock_template(datetime.now()))
+
+# Data manager section -> generator method used for lazy mock data
+_MOCK_SECTIONS = {
+    'system_values': '_gen_system_values',
+    'user_profiles': '_gen_users',
+    'groups': '_gen_groups',
+    'object_authorities': '_gen_objects'
+}
+
 class IBMiDataManager:
     """Core data management class for IBM i system data"""
     
@@ -26,21 +649,41 @@ class IBMiDataManager:
         self.system_values = {}
         self.user_profiles = {}
         self.object_authorities = {}
+        self.sv_current = dict(_REQUIRED_SYSTEM_VALUES)  # Current settings, see _refresh_indexes
+        self.sv_int = {}  # Numeric system values, see _refresh_indexes
         self.groups = {}  # Add missing groups attribute
+        self._pending_mock_sections = set()
+        self.version = 0  # Bumped on every data change; keys cached analysis results
+        self._profile_columns = None
+        self._profile_columns_source = None
+        self._profile_user_lists = None
+        self._profile_user_lists_source = None
+        self._authority_columns = None
+        self._authority_columns_source = None
         
     def save_data_to_file(self, filename: str = "ibm_i_data.json"):
-        """Save current data to JSON file for persistence"""
+        """Save current data to JSON file for persistence.
+
+        The canonical on-disk form is compact JSON (no indentation); use
+        ``dump_pretty`` when the file needs to be read by a human.
+        """
         try:
+            self.ensure_sections(*_MOCK_SECTIONS)
             data_to_save = {
                 'system_values': self.system_values,
                 'user_profiles': self.user_profiles,
-                'object_authorities': self.object_authorities,
+                'object_authorities': {
+                    obj_name: {user: auth._asdict() for user, auth in authorities.items()}
+                    for obj_name, authorities in self.object_authorities.items()
+                },
                 'groups': self.groups,
                 'timestamp': datetime.now().isoformat()
             }
             
-            with open(filename, 'w') as f:
-                json.dump(data_to_save, f, default=str, indent=2)
+            payload = json.dumps(data_to_save, default=str, separators=(',', ':')).encode('utf-8')
+            
+            with open(filename, 'wb') as f:
+                f.write(payload)
             
             logger.info(f"Data saved to {filename}")
             return True
@@ -48,16 +691,38 @@ class IBMiDataManager:
             logger.error(f"Failed to save data: {e}")
             return False
     
+    def dump_pretty(self, filename: str = "ibm_i_data.json") -> str:
+        """Return an indented rendering of a saved data file for inspection"""
+        with open(filename, 'r') as f:
+            data = json.load(f)
+        return json.dumps(data, indent=2)
+    
     def load_data_from_file(self, filename: str = "ibm_i_data.json"):
         """Load data from JSON file"""
         try:
             with open(filename, 'r') as f:
                 data = json.load(f)
             
-            self.system_values = data.get('system_values', {})
-            self.user_profiles = data.get('user_profiles', {})
-            self.object_authorities = data.get('object_authorities', {})
-            self.groups = data.get('groups', {})
+            # Build every section before assigning any, so a bad entry leaves the current data intact
+            system_values = {
+                name: _load_system_value(sysval)
+                for name, sysval in data.get('system_values', {}).items()
+            }
+            user_profiles = data.get('user_profiles', {})
+            object_authorities = {
+                obj_name: {user: ObjectAuthority.from_dict(auth) for user, auth in authorities.items()}
+                for obj_name, authorities in data.get('object_authorities', {}).items()
+            }
+            groups = data.get('groups', {})
+            for section in (system_values, user_profiles, object_authorities, groups):
+                _intern_known(section)
+            
+            self.system_values = system_values
+            self.user_profiles = user_profiles
+            self.object_authorities = object_authorities
+            self.groups = groups
+            self._pending_mock_sections.clear()
+            self.mark_modified()
             
             logger.info(f"Data loaded from {filename}")
             return True
@@ -70,461 +735,152 @@ class IBMiDataManager:
     
     def generate_mock_ibm_i_data(self):
         """Generate realistic mock IBM i system data for demonstration"""
-        
-        # Enhanced Mock System Values based on IBM Redbooks
-        self.system_values = {
-            # Security Level and Access Control
-            'QSECURITY': {
-                'current': '40',
-                'recommended': '40',
-                'description': 'System security level (10=Basic, 20=Standard, 30=Enhanced, 40=Maximum)',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001', 'NIST'],
-                'business_impact': 'High',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            
-            # Password Management
-            'QPWDEXPITV': {
-                'current': '90',
-                'recommended': '90',
-                'description': 'Password expiration interval in days',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001', 'NIST'],
-                'business_impact': 'Medium',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QPWDLVL': {
-                'current': '2',
-                'recommended': '2',
-                'description': 'Password level (0=Basic, 1=Enhanced, 2=Maximum)',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
-                'business_impact': 'Medium',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QPWDMINLEN': {
-                'current': '8',
-                'recommended': '8',
-                'description': 'Minimum password length',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001'],
-                'business_impact': 'Medium',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QPWDMAXLEN': {
-                'current': '128',
-                'recommended': '128',
-                'description': 'Maximum password length',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS'],
-                'business_impact': 'Low',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QPWDRQDDIF': {
-                'current': '5',
-                'recommended': '5',
-                'description': 'Number of different characters required in new password',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
-                'business_impact': 'Medium',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QPWDVLDPGM': {
-                'current': '*NONE',
-                'recommended': 'CUSTPWD',
-                'description': 'Password validation program name',
-                'exception': True,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
-                'business_impact': 'High',
-                'remediation_effort': 'Medium',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            
-            # Sign-on and Session Management
-            'QMAXSIGN': {
-                'current': '5',
-                'recommended': '5',
-                'description': 'Maximum sign-on attempts before account lockout',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001'],
-                'business_impact': 'High',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QMAXSGNACN': {
-                'current': '10',
-                'recommended': '10',
-                'description': 'Action when maximum sign-on attempts exceeded (*DISABLE, *ENDJOB, *ENDJOBSBS)',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
-                'business_impact': 'High',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QINACTITV': {
-                'current': '30',
-                'recommended': '30',
-                'description': 'Inactivity timeout in minutes before automatic sign-off',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001'],
-                'business_impact': 'Medium',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QINACTMSGQ': {
-                'current': '*NONE',
-                'recommended': 'INACTMSGQ',
-                'description': 'Inactive message queue for timeout notifications',
-                'exception': True,
-                'compliance_frameworks': ['SOX', 'PCI DSS'],
-                'business_impact': 'Low',
-                'remediation_effort': 'Medium',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            
-            # Audit and Journaling
-            'QAUDCTL': {
-                'current': '*AUDLVL',
-                'recommended': '*AUDLVL',
-                'description': 'Audit control (*NONE, *AUDLVL, *AUTFAIL, *AUTFAIL, *AUTFAIL)',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001', 'NIST'],
-                'business_impact': 'High',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QAUDLVL': {
-                'current': '*SECURITY',
-                'recommended': '*SECURITY',
-                'description': 'Audit level (*NONE, *SECURITY, *SECURITY, *SECURITY, *SECURITY)',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001', 'NIST'],
-                'business_impact': 'High',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QAUDLVL2': {
-                'current': '*NONE',
-                'recommended': '*SECURITY',
-                'description': 'Secondary audit level for additional events',
-                'exception': True,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
-                'business_impact': 'Medium',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QAUDJRN': {
-                'current': 'QSYS/AUDIT_JRN',
-                'recommended': 'QSYS/AUDIT_JRN',
-                'description': 'Audit journal name and library',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001', 'NIST'],
-                'business_impact': 'High',
-                'remediation_effort': 'Medium',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QAUDJRNRCV': {
-                'current': 'QSYS/AUDIT_JRN',
-                'recommended': 'QSYS/AUDIT_JRN',
-                'description': 'Audit journal receiver name and library',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
-                'business_impact': 'Medium',
-                'remediation_effort': 'Medium',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            
-            # Network and Remote Access
-            'QRMTSIGN': {
-                'current': '*NONE',
-                'recommended': '*NONE',
-                'description': 'Remote sign-on control (*NONE, *SIGNON, *SIGNON, *SIGNON)',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA', 'ISO 27001'],
-                'business_impact': 'High',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QLMTSECOFR': {
-                'current': '*YES',
-                'recommended': '*NO',
-                'description': 'Limit QSECOFR to console (*YES, *NO)',
-                'exception': True,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
-                'business_impact': 'High',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QLMTDEVSSN': {
-                'current': '*YES',
-                'recommended': '*YES',
-                'description': 'Limit device sessions (*YES, *NO)',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS'],
-                'business_impact': 'Medium',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            
-            # System Access Control
-            'QALWOBJRST': {
-                'current': '*NONE',
-                'recommended': '*NONE',
-                'description': 'Allow object restore (*NONE, *ALL, *AUTL, *AUTL)',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
-                'business_impact': 'High',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QALWOBJRSTDTA': {
-                'current': '*NONE',
-                'recommended': '*NONE',
-                'description': 'Allow object restore with data (*NONE, *ALL, *AUTL)',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA'],
-                'business_impact': 'High',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QALWUSRDMN': {
-                'current': '*NONE',
-                'recommended': '*NONE',
-                'description': 'Allow user domain (*NONE, *ALL, *AUTL)',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS'],
-                'business_impact': 'Medium',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            
-            # Library List Security
-            'QLIBLACN': {
-                'current': '*NONE',
-                'recommended': '*NONE',
-                'description': 'Library list action (*NONE, *CHGLIBL, *CHGLIBL)',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS'],
-                'business_impact': 'Medium',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            },
-            'QSPLACN': {
-                'current': '*NONE',
-                'recommended': '*NONE',
-                'description': 'Spooled file action (*NONE, *CHGSPLFA, *CHGSPLFA)',
-                'exception': False,
-                'compliance_frameworks': ['SOX', 'PCI DSS'],
-                'business_impact': 'Low',
-                'remediation_effort': 'Low',
-                'ibm_redbook_ref': 'SG24-8150'
-            }
-        }
-        
-        # Enhanced Mock User Profiles with Enterprise Scenarios
-        self.user_profiles = {
-            'QSECOFR': {
-                'name': 'Security Officer',
-                'status': '*ENABLED',
-                'group': 'QSECOFR',
-                'pass_none': '*NO',
-                'spec_auth': ['*ALLOBJ', '*SECADM'],
-                'prev_sign_on': (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d'),
-                'user_class': '*SECOFR',
-                'pass_exp': '*YES',
-                'job_title': 'Security Administrator',
-                'department': 'IT Security',
-                'last_password_change': (datetime.now() - timedelta(days=15)).strftime('%Y-%m-%d'),
-                'failed_login_attempts': 0,
-                'compliance_status': 'Compliant'
-            },
-            'JOHNDOE': {
-                'name': 'John Doe',
-                'status': '*ENABLED',
-                'group': 'USERS',
-                'pass_none': '*YES',  # Security issue
-                'spec_auth': [],
-                'prev_sign_on': (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'),
-                'user_class': '*USER',
-                'pass_exp': '*NO',
-                'job_title': 'Application Developer',
-                'department': 'Development',
-                'last_password_change': (datetime.now() - timedelta(days=120)).strftime('%Y-%m-%d'),
-                'failed_login_attempts': 2,
-                'compliance_status': 'Non-Compliant'
-            },
-            'JANESMITH': {
-                'name': 'Jane Smith',
-                'status': '*DISABLED',  # Security issue
-                'group': 'USERS',
-                'pass_none': '*NO',
-                'spec_auth': [],
-                'prev_sign_on': (datetime.now() - timedelta(days=45)).strftime('%Y-%m-%d'),
-                'user_class': '*USER',
-                'pass_exp': '*YES',
-                'job_title': 'Business Analyst',
-                'department': 'Finance',
-                'last_password_change': (datetime.now() - timedelta(days=60)).strftime('%Y-%m-%d'),
-                'failed_login_attempts': 0,
-                'compliance_status': 'Non-Compliant'
-            },
-            'ADMIN': {
-                'name': 'System Administrator',
-                'status': '*ENABLED',
-                'group': 'ADMIN',
-                'pass_none': '*NO',
-                'spec_auth': ['*ALLOBJ', '*IOSYSCFG'],
-                'prev_sign_on': (datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d'),
-                'user_class': '*SECOFR',
-                'pass_exp': '*YES',
-                'job_title': 'System Administrator',
-                'department': 'IT Operations',
-                'last_password_change': (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'),
-                'failed_login_attempts': 0,
-                'compliance_status': 'Compliant'
-            },
-            'GUEST': {
-                'name': 'Guest User',
-                'status': '*ENABLED',
-                'group': 'GUEST',
-                'pass_none': '*YES',  # Security issue
-                'spec_auth': [],
-                'prev_sign_on': (datetime.now() - timedelta(days=5)).strftime('%Y-%m-%d'),
-                'user_class': '*USER',
-                'pass_exp': '*NO',
-                'job_title': 'Guest Access',
-                'department': 'External',
-                'last_password_change': (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d'),
-                'failed_login_attempts': 0,
-                'compliance_status': 'Non-Compliant'
+        self._gen_system_values()
+        self._gen_users()
+        self._gen_groups()
+        self._gen_objects()
+        self._pending_mock_sections.clear()
+    
+    def defer_mock_ibm_i_data(self):
+        """Mark every data section to be filled with mock data on first use"""
+        self._pending_mock_sections = set(_MOCK_SECTIONS)
+    
+    def ensure_sections(self, *sections: str):
+        """Generate any requested mock data sections that are still pending"""
+        for section in sections:
+            if section in self._pending_mock_sections:
+                self._pending_mock_sections.discard(section)
+                getattr(self, _MOCK_SECTIONS[section])()
+    
+    def current_value(self, name: str, default: str = '0') -> str:
+        """Current setting of a system value, or ``default`` when it is not loaded"""
+        try:
+            return self.system_values[name]['current']
+        except KeyError:
+            return default
+    
+    def mark_modified(self):
+        """Record a change to the data so derived views and cached results are rebuilt"""
+        self.version += 1
+        self._profile_columns = None
+        self._profile_user_lists = None
+        self._authority_columns = None
+        self._refresh_indexes()
+    
+    def profile_columns(self) -> Dict[str, np.ndarray]:
+        """Column (structure-of-arrays) view of user_profiles for vectorized filters.
+
+        Holds the user ids, an int8 status code column (see _STATUS_CODES) and
+        boolean pass_none/disabled/enabled/non_compliant/allobj flags,
+        index-aligned with the profile dict order. Rebuilt when user_profiles
+        is replaced or after ``mark_modified``.
+        """
+        profiles = self.user_profiles
+        if self._profile_columns is None or self._profile_columns_source is not profiles:
+            # One pass over the profiles, reading each field once per row
+            rows = np.array([
+                (profile.get('pass_none') == _YES,
+                 _STATUS_CODES.get(profile.get('status'), 0),
+                 profile.get('compliance_status') == 'Non-Compliant',
+                 _ALLOBJ in profile.get('spec_auth', ()))
+                for profile in profiles.values()
+            ], dtype=np.int8).reshape(len(profiles), 4)
+            status = rows[:, 1]
+            self._profile_columns = {
+                'uids': np.array(list(profiles), dtype=object),
+                'status': status,
+                'pass_none': rows[:, 0] != 0,
+                'disabled': status == _STATUS_DISABLED,
+                'enabled': status == _STATUS_ENABLED,
+                'non_compliant': rows[:, 2] != 0,
+                'allobj': rows[:, 3] != 0
             }
-        }
-        
-        # Enhanced Mock Groups with Enterprise Structure
-        self.groups = {
-            'QSECOFR': {
-                'name': 'Security Officers',
-                'members': ['QSECOFR'],
-                'status': '*ENABLED',
-                'description': 'System security administrators',
-                'created_date': (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d'),
-                'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA']
-            },
-            'ADMIN': {
-                'name': 'System Administrators',
-                'members': ['ADMIN'],
-                'status': '*ENABLED',
-                'description': 'System administration team',
-                'created_date': (datetime.now() - timedelta(days=300)).strftime('%Y-%m-%d'),
-                'compliance_frameworks': ['SOX', 'PCI DSS']
-            },
-            'USERS': {
-                'name': 'General Users',
-                'members': ['JOHNDOE', 'JANESMITH'],
-                'status': '*ENABLED',
-                'description': 'Standard business users',
-                'created_date': (datetime.now() - timedelta(days=200)).strftime('%Y-%m-%d'),
-                'compliance_frameworks': ['SOX']
-            },
-            'GUEST': {
-                'name': 'Guest Access',
-                'members': ['GUEST'],
-                'status': '*ENABLED',
-                'description': 'Temporary guest access',
-                'created_date': (datetime.now() - timedelta(days=50)).strftime('%Y-%m-%d'),
-                'compliance_frameworks': []
-            },
-            'DEVELOPERS': {
-                'name': 'Development Team',
-                'members': ['JOHNDOE'],
-                'status': '*ENABLED',
-                'description': 'Application development team',
-                'created_date': (datetime.now() - timedelta(days=150)).strftime('%Y-%m-%d'),
-                'compliance_frameworks': ['SOX']
+            self._profile_columns_source = profiles
+        return self._profile_columns
+    
+    def profile_user_lists(self) -> Dict[str, List[str]]:
+        """User ids selected by the profile predicates shared across analyses.
+
+        Keys are no_pwd, disabled, no_pwd_or_disabled, non_compliant and allobj.
+        Built from ``profile_columns`` so the compliance and user management
+        evaluations reuse the same lists instead of filtering the profiles twice.
+        """
+        columns = self.profile_columns()
+        if self._profile_user_lists is None or self._profile_user_lists_source is not columns:
+            uids = columns['uids']
+
+            def select(mask: np.ndarray) -> List[str]:
+                # Most predicates match nobody on a healthy system; skip the gather then
+                return uids[mask].tolist() if mask.any() else []
+
+            self._profile_user_lists = {
+                'no_pwd': select(columns['pass_none']),
+                'disabled': select(columns['disabled']),
+                'no_pwd_or_disabled': select(columns['pass_none'] | columns['disabled']),
+                'non_compliant': select(columns['non_compliant']),
+                'allobj': select(columns['allobj'])
             }
-        }
-        
-        # Enhanced Mock Object Authorities with Enterprise Scenarios
-        self.object_authorities = {
-            'QSYS/QCMD': {
-                '*PUBLIC': {
-                    'obj_auth': '*EXCLUDE',
-                    'obj_type': '*CMD',
-                    'obj_owner': 'QSYS',
-                    'risk_level': 'Low',
-                    'compliance_frameworks': ['SOX', 'PCI DSS']
-                },
-                'QSECOFR': {
-                    'obj_auth': '*ALL',
-                    'obj_type': '*CMD',
-                    'obj_owner': 'QSYS',
-                    'risk_level': 'High',
-                    'compliance_frameworks': ['SOX', 'PCI DSS']
-                },
-                'ADMIN': {
-                    'obj_auth': '*USE',
-                    'obj_type': '*CMD',
-                    'obj_owner': 'QSYS',
-                    'risk_level': 'Medium',
-                    'compliance_frameworks': ['SOX']
-                }
-            },
-            'PRODLIB/CUSTOMER': {
-                '*PUBLIC': {
-                    'obj_auth': '*EXCLUDE',
-                    'obj_type': '*FILE',
-                    'obj_owner': 'QSECOFR',
-                    'risk_level': 'Low',
-                    'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA']
-                },
-                'JOHNDOE': {
-                    'obj_auth': '*CHANGE',
-                    'obj_type': '*FILE',
-                    'obj_owner': 'QSECOFR',
-                    'risk_level': 'Medium',
-                    'compliance_frameworks': ['SOX', 'PCI DSS']
-                }
-            },
-            'FINLIB/PAYROLL': {
-                '*PUBLIC': {
-                    'obj_auth': '*EXCLUDE',
-                    'obj_type': '*FILE',
-                    'obj_owner': 'QSECOFR',
-                    'risk_level': 'Low',
-                    'compliance_frameworks': ['SOX', 'PCI DSS', 'HIPAA']
-                },
-                'JANESMITH': {
-                    'obj_auth': '*READ',
-                    'obj_type': '*FILE',
-                    'obj_owner': 'QSECOFR',
-                    'risk_level': 'Low',
-                    'compliance_frameworks': ['SOX', 'PCI DSS']
-                }
-            },
-            'QSYS/QSYSOPR': {
-                '*PUBLIC': {
-                    'obj_auth': '*EXCLUDE',
-                    'obj_type': '*MSGQ',
-                    'obj_owner': 'QSYS',
-                    'risk_level': 'Low',
-                    'compliance_frameworks': ['SOX']
-                },
-                'QSECOFR': {
-                    'obj_auth': '*ALL',
-                    'obj_type': '*MSGQ',
-                    'obj_owner': 'QSYS',
-                    'risk_level': 'High',
-                    'compliance_frameworks': ['SOX']
-                }
+            self._profile_user_lists_source = columns
+        return self._profile_user_lists
+    
+    def authority_columns(self) -> Dict[str, np.ndarray]:
+        """Column view of object_authorities, one row per (object, user) grant.
+
+        Holds the object names and users plus boolean all_auth (*ALL grant),
+        privileged (user in _PRIVILEGED_USERS) and qsys (object in library
+        QSYS) flags, in dict iteration order.
+        Rebuilt when object_authorities is replaced or after ``mark_modified``.
+        """
+        authorities = self.object_authorities
+        if self._authority_columns is None or self._authority_columns_source is not authorities:
+            rows = [
+                (obj_name, user, auth_data.obj_auth == _ALL)
+                for obj_name, grants in authorities.items()
+                for user, auth_data in grants.items()
+            ]
+            objects = np.array([row[0] for row in rows], dtype=object)
+            users = np.array([row[1] for row in rows], dtype=object)
+            self._authority_columns = {
+                'objects': objects,
+                'users': users,
+                'all_auth': np.array([row[2] for row in rows], dtype=bool),
+                'privileged': np.array([user in _PRIVILEGED_USERS for user in users], dtype=bool),
+                'qsys': np.array([obj_name.startswith('QSYS/') for obj_name in objects], dtype=bool)
             }
+            self._authority_columns_source = authorities
+        return self._authority_columns
+    
+    def _refresh_indexes(self):
+        """Rebuild lookups derived from system values.
+
+        Called from ``mark_modified``, so the parsed system values (QSECURITY,
+        QMAXSIGN, ...) are computed once per data version rather than per control.
+        """
+        self.sv_current = {
+            **_REQUIRED_SYSTEM_VALUES,
+            **{name: sysval['current'] for name, sysval in self.system_values.items() if 'current' in sysval}
         }
+        self.sv_int = _parse_system_value_ints(self.sv_current)
+    
+    def _gen_system_values(self):
+        """Load mock system values from the template"""
+        self.system_values = copy.deepcopy(_MOCK_TEMPLATE['system_values'])
+        self.mark_modified()
+    
+    def _gen_users(self):
+        """Load mock user profiles from the template"""
+        self.user_profiles = copy.deepcopy(_MOCK_TEMPLATE['user_profiles'])
+        self.mark_modified()
+    
+    def _gen_groups(self):
+        """Load mock groups from the template"""
+        self.groups = copy.deepcopy(_MOCK_TEMPLATE['groups'])
+        self.mark_modified()
+    
+    def _gen_objects(self):
+        """Load mock object authorities from the template"""
+        self.object_authorities = copy.deepcopy(_MOCK_TEMPLATE['object_authorities'])
+        self.mark_modified()
 
 class IBMiObjectAuthority:
     """Object authority analysis class"""
@@ -535,12 +891,13 @@ class IBMiObjectAuthority:
     def analyze_object_authorities(self) -> pd.DataFrame:
         """Analyze object authorities and return security issues"""
         results = []
+        scores = []
         
         for obj_name, authorities in self.data_manager.object_authorities.items():
             for user, auth_data in authorities.items():
                 security_issues = []
                 
-                if auth_data.get('obj_auth') == '*ALL':
+                if auth_data.obj_auth == _ALL:
                     security_issues.append("Excessive object authority")
                 
                 if user == '*PUBLIC' and obj_name.startswith('QSYS/'):
@@ -550,15 +907,20 @@ class IBMiObjectAuthority:
                     results.append({
                         'object': obj_name,
                         'user': user,
-                        'object_type': auth_data.get('obj_type', 'Unknown'),
-                        'security_issues': '; '.join(security_issues),
-                        'risk_level': self._calculate_risk_level(security_issues, auth_data.get('obj_type'))
+                        'object_type': auth_data.obj_type,
+                        'security_issues': '; '.join(security_issues)
                     })
+                    scores.append(self._calculate_risk_score(security_issues, auth_data.obj_type))
         
-        return pd.DataFrame(results)
+        if not results:
+            # Keep the column schema so callers never need to check for risk_level
+            return _categorize_results(_EMPTY_AUDIT_RESULTS['object_authorities'].copy())
+        df = pd.DataFrame(results)
+        df['risk_level'] = _risk_levels_from_scores(scores)
+        return _categorize_results(df)
     
-    def _calculate_risk_level(self, security_issues: List[str], object_type: str = None) -> str:
-        """Calculate risk level based on security issues"""
+    def _calculate_risk_score(self, security_issues: List[str], object_type: str = None) -> int:
+        """Calculate numeric risk score based on security issues"""
         base_score = len(security_issues) * 10
         
         if object_type:
@@ -570,12 +932,7 @@ class IBMiObjectAuthority:
             }
             base_score += object_risk_factors.get(object_type, 3)
         
-        if base_score >= 40:
-            return 'High'
-        elif base_score >= 20:
-            return 'Medium'
-        else:
-            return 'Low'
+        return base_score
 
 class IBMiUserProfiles:
     """User profile analysis class"""
@@ -586,18 +943,21 @@ class IBMiUserProfiles:
     def analyze_user_profiles(self) -> pd.DataFrame:
         """Analyze user profiles and return security issues"""
         results = []
+        scores = []
+        # *ALLOBJ flags come from the column view, index-aligned with the profiles
+        allobj_flags = self.data_manager.profile_columns()['allobj'].tolist()
         
-        for user_id, profile in self.data_manager.user_profiles.items():
+        for (user_id, profile), has_allobj in zip(self.data_manager.user_profiles.items(), allobj_flags):
             security_issues = []
             
-            if profile.get('pass_none') == '*YES':
+            if profile.get('pass_none') == _YES:
                 security_issues.append("No password set")
             
-            if profile.get('status') == '*DISABLED':
+            if profile.get('status') == _DISABLED:
                 security_issues.append("Account disabled")
             
-            spec_auth = profile.get('spec_auth', [])
-            if '*ALLOBJ' in spec_auth:
+            spec_auth = profile.get('spec_auth', ())
+            if has_allobj:
                 security_issues.append("All object authority")
             
             if security_issues:
@@ -607,30 +967,30 @@ class IBMiUserProfiles:
                     'status': profile.get('status', 'Unknown'),
                     'group': profile.get('group', 'Unknown'),
                     'special_authorities': ', '.join(spec_auth) if spec_auth else 'None',
-                    'security_issues': '; '.join(security_issues),
-                    'risk_level': self._calculate_risk_level(security_issues, profile)
+                    'security_issues': '; '.join(security_issues)
                 })
+                scores.append(self._calculate_risk_score(security_issues, profile))
         
-        return pd.DataFrame(results)
+        if not results:
+            # Keep the column schema so callers never need to check for risk_level
+            return _categorize_results(_EMPTY_AUDIT_RESULTS['user_profiles'].copy())
+        df = pd.DataFrame(results)
+        df['risk_level'] = _risk_levels_from_scores(scores)
+        return _categorize_results(df)
     
-    def _calculate_risk_level(self, security_issues: List[str], user_profile: Dict = None) -> str:
-        """Calculate risk level based on security issues"""
+    def _calculate_risk_score(self, security_issues: List[str], user_profile: Dict = None) -> int:
+        """Calculate numeric risk score based on security issues"""
         base_score = len(security_issues) * 10
         
         if user_profile:
-            if user_profile.get('pass_none') == '*YES':
+            if user_profile.get('pass_none') == _YES:
                 base_score += 20
-            if user_profile.get('status') == '*DISABLED':
+            if user_profile.get('status') == _DISABLED:
                 base_score += 15
-            if '*ALLOBJ' in user_profile.get('spec_auth', []):
+            if _ALLOBJ in user_profile.get('spec_auth', ()):
                 base_score += 25
         
-        if base_score >= 40:
-            return 'High'
-        elif base_score >= 20:
-            return 'Medium'
-        else:
-            return 'Low'
+        return base_score
 
 class IBMiSystemValues:
     """System values analysis class"""
@@ -638,1611 +998,1457 @@ class IBMiSystemValues:
     def __init__(self, data_manager: IBMiDataManager):
         self.data_manager = data_manager
     
-    def analyze_system_values(self) -> pd.DataFrame:
-        """Analyze system values and return compliance issues"""
+    def analyze_system_values(self, only_exceptions: bool = False) -> pd.DataFrame:
+        """Analyze system values and return compliance issues
+        
+        With only_exceptions=True the compliant values are skipped and only
+        the non-compliant rows are built.
+        """
+        sysvals = self.data_manager.system_values.items()
+        if only_exceptions:
+            sysvals = [(name, data) for name, data in sysvals if data.get('exception', False)]
+        
         results = []
+        for sysval_name, sysval_data in sysvals:
+            exception = sysval_data.get('exception', False)
+            results.append({
+                'system_value': sysval_name,
+                'current_value': sysval_data.get('current', 'Unknown'),
+                'recommended_value': sysval_data.get('recommended', 'Unknown'),
+                'description': sysval_data.get('description', 'Unknown'),
+                'compliance_status': 'Non-Compliant' if exception else 'Compliant',
+                'risk_level': 'High' if exception else 'Low'
+            })
         
-        for sysval_name, sysval_data in self.data_manager.system_values.items():
-            if sysval_data.get('exception', False):
-                results.append({
-                    'system_value': sysval_name,
-                    'current_value': sysval_data.get('current', 'Unknown'),
-                    'recommended_value': sysval_data.get('recommended', 'Unknown'),
-                    'description': sysval_data.get('description', 'Unknown'),
-                    'compliance_status': 'Non-Compliant',
-                    'risk_level': 'High'
-                })
-            else:
-                results.append({
-                    'system_value': sysval_name,
-                    'current_value': sysval_data.get('current', 'Unknown'),
-                    'recommended_value': sysval_data.get('recommended', 'Unknown'),
-                    'description': sysval_data.get('description', 'Unknown'),
-                    'compliance_status': 'Compliant',
-                    'risk_level': 'Low'
-                })
+        if not results:
+            return _categorize_results(_EMPTY_AUDIT_RESULTS['system_values'].copy())
+        return _categorize_results(pd.DataFrame(results))
+
+class _ControlDefinition(NamedTuple):
+    """Static definition of a compliance control; status/evidence/remediation are defaults"""
+    id: str
+    title: str
+    description: str
+    requirement: str
+    test_method: str
+    pass_criteria: str
+    status: str
+    evidence: str
+    remediation: str
+    priority: str
+
+class _FrameworkDefinition(NamedTuple):
+    """Static definition of a compliance framework and its controls"""
+    name: str
+    description: str
+    controls: Tuple[_ControlDefinition, ...]
+
+def _freeze_frameworks(frameworks: Dict[str, _FrameworkDefinition]) -> Mapping[str, _FrameworkDefinition]:
+    """Read-only view of framework definitions with names and status/priority labels interned"""
+    return MappingProxyType({
+        sys.intern(name): framework._replace(controls=tuple(
+            control._replace(status=sys.intern(control.status), priority=sys.intern(control.priority))
+            for control in framework.controls
+        ))
+        for name, framework in frameworks.items()
+    })
+
+# Static framework/control definitions for analyze_compliance_frameworks.
+# Fully immutable, so it is shared as-is; each audit run builds its own
+# result dicts from it.
+_COMPLIANCE_CONTROLS_TEMPLATE = _freeze_frameworks({
+    'SOX': _FrameworkDefinition(
+        name='Sarbanes-Oxley Act',
+        description='Financial reporting and corporate governance',
+        controls=(
+            _ControlDefinition(
+                id='SOX-001',
+                title='Password Policy Enforcement',
+                description='System must enforce password policies including expiration and complexity',
+                requirement='SOX Section 404 - Internal Controls',
+                test_method='Check QPWDEXPITV and QPWDCHGCYC system values',
+                pass_criteria='Password expiration enabled and change cycle required',
+                status='PASS',
+                evidence='',
+                remediation='',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='SOX-002',
+                title='Access Control Monitoring',
+                description='System must monitor and log access to financial data',
+                requirement='SOX Section 404 - Access Controls',
+                test_method='Check QINACTMSGQ system value for inactivity monitoring',
+                pass_criteria='Inactivity message queue configured',
+                status='FAIL',
+                evidence='QINACTMSGQ set to *NONE',
+                remediation='Set QINACTMSGQ to QSYSOPR',
+                priority='Medium'
+            ),
+            _ControlDefinition(
+                id='SOX-003',
+                title='User Account Management',
+                description='All user accounts must be properly managed and monitored',
+                requirement='SOX Section 404 - User Management',
+                test_method='Review user profiles for compliance status',
+                pass_criteria='All users have proper passwords and are enabled',
+                status='FAIL',
+                evidence='3 users with security issues found',
+                remediation='Fix password and account issues for JOHNDOE, JANESMITH, GUEST',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='SOX-004',
+                title='System Security Level',
+                description='System must operate at appropriate security level',
+                requirement='SOX Section 404 - System Security',
+                test_method='Check QSECURITY system value',
+                pass_criteria='QSECURITY set to 40 or higher',
+                status='PASS',
+                evidence='QSECURITY set to 40',
+                remediation='',
+                priority='High'
+            )
+        )
+    ),
+    'PCI DSS': _FrameworkDefinition(
+        name='Payment Card Industry Data Security Standard',
+        description='Payment card data security',
+        controls=(
+            _ControlDefinition(
+                id='PCI-001',
+                title='Strong Password Requirements',
+                description='Implement strong password policies for all users',
+                requirement='PCI DSS Requirement 8.2',
+                test_method='Check password validation program and expiration settings',
+                pass_criteria='Password validation program configured and expiration enabled',
+                status='FAIL',
+                evidence='QPWDVLDPGM set to *NONE, QPWDCHGCYC set to 0',
+                remediation='Configure QPWDVLDPGM and enable password change cycle',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='PCI-002',
+                title='Access Control Implementation',
+                description='Restrict access to cardholder data based on job function',
+                requirement='PCI DSS Requirement 7.1',
+                test_method='Review object authorities for sensitive data files',
+                pass_criteria='No excessive object authorities on sensitive files',
+                status='FAIL',
+                evidence='QSECOFR has *ALL authority on system objects',
+                remediation='Review and restrict QSECOFR object authorities',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='PCI-003',
+                title='Failed Login Attempts',
+                description='Limit repeated access attempts by locking out user IDs',
+                requirement='PCI DSS Requirement 8.1.6',
+                test_method='Check QMAXSIGN system value',
+                pass_criteria='QMAXSIGN set to 5 or fewer attempts',
+                status='PASS',
+                evidence='QMAXSIGN set to 5',
+                remediation='',
+                priority='Medium'
+            ),
+            _ControlDefinition(
+                id='PCI-004',
+                title='User Authentication',
+                description='Ensure all users have proper authentication',
+                requirement='PCI DSS Requirement 8.1',
+                test_method='Review user profiles for password requirements',
+                pass_criteria='All users have passwords set',
+                status='FAIL',
+                evidence='JOHNDOE and GUEST have no passwords set',
+                remediation='Set passwords for JOHNDOE and GUEST users',
+                priority='Critical'
+            )
+        )
+    ),
+    'HIPAA': _FrameworkDefinition(
+        name='Health Insurance Portability and Accountability Act',
+        description='Healthcare data privacy and security',
+        controls=(
+            _ControlDefinition(
+                id='HIPAA-001',
+                title='Access Control',
+                description='Implement technical policies and procedures for electronic information systems',
+                requirement='HIPAA Security Rule 164.312(a)(1)',
+                test_method='Review user access controls and authentication',
+                pass_criteria='All users have proper access controls and authentication',
+                status='FAIL',
+                evidence='Multiple users with authentication and access control issues',
+                remediation='Implement proper access controls for all users',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='HIPAA-002',
+                title='Audit Controls',
+                description='Implement hardware, software, and/or procedural mechanisms to record and examine access',
+                requirement='HIPAA Security Rule 164.312(b)',
+                test_method='Check system values for audit and monitoring capabilities',
+                pass_criteria='Audit controls and monitoring enabled',
+                status='FAIL',
+                evidence='QINACTMSGQ not configured for monitoring',
+                remediation='Configure inactivity monitoring and audit controls',
+                priority='Medium'
+            ),
+            _ControlDefinition(
+                id='HIPAA-003',
+                title='Person or Entity Authentication',
+                description='Implement procedures to verify that a person or entity seeking access is authorized',
+                requirement='HIPAA Security Rule 164.312(d)',
+                test_method='Review user authentication mechanisms',
+                pass_criteria='All users have proper authentication',
+                status='FAIL',
+                evidence='Users without passwords and disabled accounts found',
+                remediation='Ensure all users have proper authentication',
+                priority='Critical'
+            ),
+            _ControlDefinition(
+                id='HIPAA-004',
+                title='Transmission Security',
+                description='Implement technical security measures to guard against unauthorized access',
+                requirement='HIPAA Security Rule 164.312(c)(1)',
+                test_method='Check system security level and access controls',
+                pass_criteria='System security level appropriate and access controlled',
+                status='PASS',
+                evidence='QSECURITY set to 40',
+                remediation='',
+                priority='Medium'
+            )
+        )
+    ),
+    'ISO 27001': _FrameworkDefinition(
+        name='ISO/IEC 27001 Information Security Management',
+        description='International standard for information security management systems',
+        controls=(
+            _ControlDefinition(
+                id='ISO-001',
+                title='Access Control Policy',
+                description='Define and implement access control policy based on business requirements',
+                requirement='ISO 27001 A.9.1.1',
+                test_method='Review system security level and access control mechanisms',
+                pass_criteria='Access control policy implemented and enforced',
+                status='PASS',
+                evidence='QSECURITY set to 40 with proper access controls',
+                remediation='',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='ISO-002',
+                title='User Registration and De-registration',
+                description='Formal user registration and de-registration process for access to systems',
+                requirement='ISO 27001 A.9.2.1',
+                test_method='Review user profile management and status',
+                pass_criteria='All users properly registered and managed',
+                status='FAIL',
+                evidence='GUEST account disabled, JOHNDOE has no password',
+                remediation='Review and fix user registration issues',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='ISO-003',
+                title='Password Management System',
+                description='Implement secure password management system',
+                requirement='ISO 27001 A.9.3.1',
+                test_method='Check password policies and validation',
+                pass_criteria='Strong password policy enforced',
+                status='FAIL',
+                evidence='QPWDVLDPGM not configured, weak password settings',
+                remediation='Implement strong password validation program',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='ISO-004',
+                title='Privileged Access Rights',
+                description='Allocation and use of privileged access rights',
+                requirement='ISO 27001 A.9.2.3',
+                test_method='Review special authorities and object access',
+                pass_criteria='Privileged access properly controlled',
+                status='FAIL',
+                evidence='QSECOFR has excessive *ALL authorities',
+                remediation='Review and restrict privileged access rights',
+                priority='Critical'
+            ),
+            _ControlDefinition(
+                id='ISO-005',
+                title='Information Access Restriction',
+                description='Restrict access to information and application system functions',
+                requirement='ISO 27001 A.9.1.2',
+                test_method='Review object authorities and access controls',
+                pass_criteria='Information access properly restricted',
+                status='FAIL',
+                evidence='Multiple excessive object authorities found',
+                remediation='Implement proper access restrictions',
+                priority='High'
+            )
+        )
+    ),
+    'NIST': _FrameworkDefinition(
+        name='NIST Cybersecurity Framework',
+        description='Framework for improving critical infrastructure cybersecurity',
+        controls=(
+            _ControlDefinition(
+                id='NIST-001',
+                title='Identity Management and Access Control',
+                description='Implement identity management and access control capabilities',
+                requirement='NIST CSF ID.AM-6',
+                test_method='Review user identity management and access controls',
+                pass_criteria='Proper identity management and access control implemented',
+                status='FAIL',
+                evidence='Multiple identity and access control issues found',
+                remediation='Implement proper identity management and access controls',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='NIST-002',
+                title='Asset Inventory',
+                description='Maintain inventory of authorized and unauthorized devices and software',
+                requirement='NIST CSF ID.AM-1',
+                test_method='Review system object inventory and access',
+                pass_criteria='Complete asset inventory maintained',
+                status='PASS',
+                evidence='System objects properly inventoried and tracked',
+                remediation='',
+                priority='Medium'
+            ),
+            _ControlDefinition(
+                id='NIST-003',
+                title='Access Control Implementation',
+                description='Implement access control policies and procedures',
+                requirement='NIST CSF PR.AC-1',
+                test_method='Review access control mechanisms and policies',
+                pass_criteria='Access control policies properly implemented',
+                status='FAIL',
+                evidence='Access control policies not fully implemented',
+                remediation='Implement comprehensive access control policies',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='NIST-004',
+                title='Continuous Monitoring',
+                description='Implement continuous monitoring capabilities',
+                requirement='NIST CSF DE.CM-1',
+                test_method='Check monitoring and logging capabilities',
+                pass_criteria='Continuous monitoring implemented',
+                status='FAIL',
+                evidence='QINACTMSGQ not configured for monitoring',
+                remediation='Implement continuous monitoring capabilities',
+                priority='Medium'
+            ),
+            _ControlDefinition(
+                id='NIST-005',
+                title='Incident Response',
+                description='Implement incident response capabilities',
+                requirement='NIST CSF RS.RP-1',
+                test_method='Review incident response and monitoring capabilities',
+                pass_criteria='Incident response capabilities implemented',
+                status='FAIL',
+                evidence='No incident response monitoring configured',
+                remediation='Implement incident response and monitoring',
+                priority='High'
+            )
+        )
+    ),
+    'HI-TRUST': _FrameworkDefinition(
+        name='HITRUST Common Security Framework',
+        description='Comprehensive security framework for healthcare organizations',
+        controls=(
+            _ControlDefinition(
+                id='HITRUST-001',
+                title='Access Control Policy and Procedures',
+                description='Establish, document, and disseminate access control policy',
+                requirement='HITRUST CSF 01.a',
+                test_method='Review access control policy implementation',
+                pass_criteria='Access control policy established and documented',
+                status='FAIL',
+                evidence='No formal access control policy documented',
+                remediation='Establish and document access control policy',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='HITRUST-002',
+                title='Account Management',
+                description='Establish and maintain procedures for account management',
+                requirement='HITRUST CSF 01.b',
+                test_method='Review user account management procedures',
+                pass_criteria='Account management procedures implemented',
+                status='FAIL',
+                evidence='Account management procedures not properly implemented',
+                remediation='Implement proper account management procedures',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='HITRUST-003',
+                title='Access Enforcement',
+                description='Enforce access control policy for all users',
+                requirement='HITRUST CSF 01.c',
+                test_method='Review access enforcement mechanisms',
+                pass_criteria='Access control policy enforced for all users',
+                status='FAIL',
+                evidence='Access control not properly enforced',
+                remediation='Enforce access control policy consistently',
+                priority='Critical'
+            ),
+            _ControlDefinition(
+                id='HITRUST-004',
+                title='Information Flow Enforcement',
+                description='Enforce information flow control policy',
+                requirement='HITRUST CSF 01.d',
+                test_method='Review information flow controls',
+                pass_criteria='Information flow controls implemented',
+                status='FAIL',
+                evidence='Information flow controls not implemented',
+                remediation='Implement information flow controls',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='HITRUST-005',
+                title='Separation of Duties',
+                description='Implement separation of duties for critical functions',
+                requirement='HITRUST CSF 01.e',
+                test_method='Review user roles and responsibilities',
+                pass_criteria='Separation of duties implemented',
+                status='FAIL',
+                evidence='QSECOFR has excessive privileges',
+                remediation='Implement proper separation of duties',
+                priority='Critical'
+            ),
+            _ControlDefinition(
+                id='HITRUST-006',
+                title='Least Privilege',
+                description='Implement least privilege principle for user access',
+                requirement='HITRUST CSF 01.f',
+                test_method='Review user privileges and access rights',
+                pass_criteria='Least privilege principle implemented',
+                status='FAIL',
+                evidence='Multiple users have excessive privileges',
+                remediation='Implement least privilege principle',
+                priority='High'
+            )
+        )
+    )
+})
+
+# Static framework/control definitions for analyze_user_management_compliance,
+# shared across runs in the same way as _COMPLIANCE_CONTROLS_TEMPLATE.
+_USER_MGMT_CONTROLS_TEMPLATE = _freeze_frameworks({
+    'SOX': _FrameworkDefinition(
+        name='Sarbanes-Oxley Act - User Management',
+        description='User management controls for financial reporting compliance',
+        controls=(
+            _ControlDefinition(
+                id='SOX-UM-001',
+                title='User Account Lifecycle Management',
+                description='Proper user account creation, modification, and termination processes',
+                requirement='SOX Section 404 - User Management Controls',
+                test_method='Review user profile status and management procedures',
+                pass_criteria='All user accounts properly managed and documented',
+                status='PASS',
+                evidence='',
+                remediation='',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='SOX-UM-002',
+                title='Password Policy Enforcement',
+                description='Strong password policies enforced for all users',
+                requirement='SOX Section 404 - Authentication Controls',
+                test_method='Check user password settings and policies',
+                pass_criteria='All users have passwords and password policies enforced',
+                status='FAIL',
+                evidence='Multiple users without passwords found',
+                remediation='Enforce password requirements for all users',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='SOX-UM-003',
+                title='User Access Review',
+                description='Regular review of user access and privileges',
+                requirement='SOX Section 404 - Access Control Monitoring',
+                test_method='Review user special authorities and access rights',
+                pass_criteria='User access regularly reviewed and documented',
+                status='FAIL',
+                evidence='Users with excessive privileges found',
+                remediation='Implement regular user access reviews',
+                priority='Medium'
+            ),
+            _ControlDefinition(
+                id='SOX-UM-004',
+                title='User Activity Monitoring',
+                description='Monitor and log user activities for audit purposes',
+                requirement='SOX Section 404 - Audit Controls',
+                test_method='Check user activity logging and monitoring',
+                pass_criteria='User activities properly monitored and logged',
+                status='PASS',
+                evidence='User activity monitoring enabled',
+                remediation='',
+                priority='Medium'
+            )
+        )
+    ),
+    'PCI DSS': _FrameworkDefinition(
+        name='Payment Card Industry Data Security Standard - User Management',
+        description='User management controls for payment card data security',
+        controls=(
+            _ControlDefinition(
+                id='PCI-UM-001',
+                title='Unique User Identification',
+                description='Each user must have a unique identifier',
+                requirement='PCI DSS Requirement 8.1',
+                test_method='Review user profile uniqueness and identification',
+                pass_criteria='All users have unique identifiers',
+                status='PASS',
+                evidence='All users have unique user IDs',
+                remediation='',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='PCI-UM-002',
+                title='Strong Authentication',
+                description='Implement strong authentication mechanisms',
+                requirement='PCI DSS Requirement 8.2',
+                test_method='Check user password strength and authentication',
+                pass_criteria='Strong authentication implemented for all users',
+                status='FAIL',
+                evidence='Users without passwords and weak authentication found',
+                remediation='Implement strong authentication for all users',
+                priority='Critical'
+            ),
+            _ControlDefinition(
+                id='PCI-UM-003',
+                title='Account Management',
+                description='Proper account management and lifecycle controls',
+                requirement='PCI DSS Requirement 8.3',
+                test_method='Review account management procedures and status',
+                pass_criteria='Account management properly implemented',
+                status='FAIL',
+                evidence='Account management issues found',
+                remediation='Implement proper account management procedures',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='PCI-UM-004',
+                title='Access Control',
+                description='Restrict access based on job function',
+                requirement='PCI DSS Requirement 7.1',
+                test_method='Review user access rights and job functions',
+                pass_criteria='Access restricted based on job function',
+                status='FAIL',
+                evidence='Users with excessive access rights found',
+                remediation='Restrict user access based on job function',
+                priority='High'
+            )
+        )
+    ),
+    'HIPAA': _FrameworkDefinition(
+        name='Health Insurance Portability and Accountability Act - User Management',
+        description='User management controls for healthcare data privacy',
+        controls=(
+            _ControlDefinition(
+                id='HIPAA-UM-001',
+                title='Unique User Identification',
+                description='Assign unique user identification for each user',
+                requirement='HIPAA Security Rule 164.312(a)(2)(i)',
+                test_method='Review user identification and uniqueness',
+                pass_criteria='All users have unique identification',
+                status='PASS',
+                evidence='All users have unique user IDs',
+                remediation='',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='HIPAA-UM-002',
+                title='Emergency Access Procedures',
+                description='Establish emergency access procedures',
+                requirement='HIPAA Security Rule 164.312(a)(2)(ii)',
+                test_method='Review emergency access procedures and accounts',
+                pass_criteria='Emergency access procedures established',
+                status='FAIL',
+                evidence='No emergency access procedures documented',
+                remediation='Establish emergency access procedures',
+                priority='Medium'
+            ),
+            _ControlDefinition(
+                id='HIPAA-UM-003',
+                title='Automatic Logoff',
+                description='Implement automatic logoff mechanisms',
+                requirement='HIPAA Security Rule 164.312(a)(2)(iii)',
+                test_method='Check automatic logoff settings and procedures',
+                pass_criteria='Automatic logoff implemented',
+                status='FAIL',
+                evidence='Automatic logoff not configured',
+                remediation='Implement automatic logoff mechanisms',
+                priority='Medium'
+            ),
+            _ControlDefinition(
+                id='HIPAA-UM-004',
+                title='Encryption and Decryption',
+                description='Implement encryption for user authentication',
+                requirement='HIPAA Security Rule 164.312(c)(2)',
+                test_method='Review user authentication encryption',
+                pass_criteria='User authentication properly encrypted',
+                status='PASS',
+                evidence='User authentication encryption enabled',
+                remediation='',
+                priority='High'
+            )
+        )
+    ),
+    'ISO 27001': _FrameworkDefinition(
+        name='ISO/IEC 27001 Information Security Management - User Management',
+        description='User management controls for information security',
+        controls=(
+            _ControlDefinition(
+                id='ISO-UM-001',
+                title='User Registration and De-registration',
+                description='Formal user registration and de-registration process',
+                requirement='ISO 27001 A.9.2.1',
+                test_method='Review user registration and de-registration procedures',
+                pass_criteria='Formal user registration process implemented',
+                status='FAIL',
+                evidence='No formal user registration process documented',
+                remediation='Implement formal user registration process',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='ISO-UM-002',
+                title='Privilege Management',
+                description='Allocation and use of privileged access rights',
+                requirement='ISO 27001 A.9.2.3',
+                test_method='Review user privilege allocation and management',
+                pass_criteria='Privileged access properly managed',
+                status='FAIL',
+                evidence='Users with excessive privileges found',
+                remediation='Implement proper privilege management',
+                priority='Critical'
+            ),
+            _ControlDefinition(
+                id='ISO-UM-003',
+                title='Password Management',
+                description='Secure password management system',
+                requirement='ISO 27001 A.9.3.1',
+                test_method='Review password management and policies',
+                pass_criteria='Secure password management implemented',
+                status='FAIL',
+                evidence='Weak password management found',
+                remediation='Implement secure password management',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='ISO-UM-004',
+                title='User Access Review',
+                description='Regular review of user access rights',
+                requirement='ISO 27001 A.9.2.5',
+                test_method='Review user access review procedures',
+                pass_criteria='Regular user access reviews conducted',
+                status='FAIL',
+                evidence='No regular access reviews documented',
+                remediation='Implement regular user access reviews',
+                priority='Medium'
+            )
+        )
+    ),
+    'NIST': _FrameworkDefinition(
+        name='NIST Cybersecurity Framework - User Management',
+        description='User management controls for cybersecurity framework',
+        controls=(
+            _ControlDefinition(
+                id='NIST-UM-001',
+                title='Identity Management',
+                description='Implement identity management capabilities',
+                requirement='NIST CSF ID.AM-6',
+                test_method='Review identity management implementation',
+                pass_criteria='Identity management properly implemented',
+                status='FAIL',
+                evidence='Identity management issues found',
+                remediation='Implement proper identity management',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='NIST-UM-002',
+                title='Access Control',
+                description='Implement access control policies',
+                requirement='NIST CSF PR.AC-1',
+                test_method='Review access control implementation',
+                pass_criteria='Access control policies implemented',
+                status='FAIL',
+                evidence='Access control policy gaps found',
+                remediation='Implement comprehensive access control policies',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='NIST-UM-003',
+                title='User Training',
+                description='Provide user security awareness training',
+                requirement='NIST CSF PR.AT-1',
+                test_method='Review user training and awareness programs',
+                pass_criteria='User security training provided',
+                status='FAIL',
+                evidence='No user security training documented',
+                remediation='Implement user security awareness training',
+                priority='Medium'
+            ),
+            _ControlDefinition(
+                id='NIST-UM-004',
+                title='Incident Response',
+                description='User-related incident response capabilities',
+                requirement='NIST CSF RS.RP-1',
+                test_method='Review user incident response procedures',
+                pass_criteria='User incident response procedures established',
+                status='FAIL',
+                evidence='No user incident response procedures found',
+                remediation='Establish user incident response procedures',
+                priority='Medium'
+            )
+        )
+    ),
+    'HI-TRUST': _FrameworkDefinition(
+        name='HITRUST Common Security Framework - User Management',
+        description='User management controls for healthcare security framework',
+        controls=(
+            _ControlDefinition(
+                id='HITRUST-UM-001',
+                title='Account Management',
+                description='Establish and maintain account management procedures',
+                requirement='HITRUST CSF 01.b',
+                test_method='Review account management procedures',
+                pass_criteria='Account management procedures implemented',
+                status='FAIL',
+                evidence='Account management procedures not properly implemented',
+                remediation='Implement proper account management procedures',
+                priority='High'
+            ),
+            _ControlDefinition(
+                id='HITRUST-UM-002',
+                title='Access Enforcement',
+                description='Enforce access control policy for all users',
+                requirement='HITRUST CSF 01.c',
+                test_method='Review access enforcement mechanisms',
+                pass_criteria='Access control policy enforced for all users',
+                status='FAIL',
+                evidence='Access control not properly enforced',
+                remediation='Enforce access control policy consistently',
+                priority='Critical'
+            ),
+            _ControlDefinition(
+                id='HITRUST-UM-003',
+                title='Separation of Duties',
+                description='Implement separation of duties for user functions',
+                requirement='HITRUST CSF 01.e',
+                test_method='Review user role separation and duties',
+                pass_criteria='Separation of duties implemented',
+                status='FAIL',
+                evidence='Users with conflicting duties found',
+                remediation='Implement proper separation of duties',
+                priority='Critical'
+            ),
+            _ControlDefinition(
+                id='HITRUST-UM-004',
+                title='Least Privilege',
+                description='Implement least privilege principle for user access',
+                requirement='HITRUST CSF 01.f',
+                test_method='Review user privileges and access rights',
+                pass_criteria='Least privilege principle implemented',
+                status='FAIL',
+                evidence='Users with excessive privileges found',
+                remediation='Implement least privilege principle',
+                priority='High'
+            )
+        )
+    )
+})
+
+class _ComplianceFacts(NamedTuple):
+    """System values and data shared by the compliance evaluators, read once per run"""
+    pwd_exp: str
+    pwd_cycle: str
+    pwd_val: str
+    inact_msgq: str
+    qsecurity: str
+    max_sign: str
+    # Pass/fail predicates shared by several controls
+    password_expiry_enabled: bool
+    password_validation_enabled: bool
+    inactivity_monitoring: bool
+    security_level_ok: bool
+    max_sign_ok: bool
+    qsys_authority_restricted: bool
+    privileged_access_restricted: bool  # No privileged user (QSECOFR) holds *ALL authority
+    all_authority_restricted: bool  # No *ALL grants at all
+    users_no_pwd: List[str]
+    disabled_users: List[str]
+    users_no_pwd_or_disabled: List[str]
+    non_compliant_users: List[str]
+    all_authority_preview: str  # 'USER on OBJECT, ...' for the first three *ALL grants
+    object_authorities: Dict[str, Dict[str, ObjectAuthority]]
+    joined: Dict[str, str]
+
+    @classmethod
+    def from_data_manager(cls, dm: IBMiDataManager) -> '_ComplianceFacts':
+        current = dm.sv_current
+        user_lists = dm.profile_user_lists()
+        grants = dm.authority_columns()
+        all_auth = grants['all_auth']
+        # Evidence only shows three grants, so only those are formatted
+        preview_rows = np.flatnonzero(all_auth)[:3]
+        pwd_cycle_enabled = current['QPWDCHGCYC'] != '0'
+        return cls(
+            pwd_exp=current['QPWDEXPITV'],
+            pwd_cycle=current['QPWDCHGCYC'],
+            pwd_val=current['QPWDVLDPGM'],
+            inact_msgq=current['QINACTMSGQ'],
+            qsecurity=current['QSECURITY'],
+            max_sign=current['QMAXSIGN'],
+            password_expiry_enabled=current['QPWDEXPITV'] != '0' and pwd_cycle_enabled,
+            password_validation_enabled=current['QPWDVLDPGM'] != _NONE and pwd_cycle_enabled,
+            inactivity_monitoring=current['QINACTMSGQ'] != _NONE,
+            security_level_ok=dm.sv_int.get('QSECURITY', 0) >= 40,
+            max_sign_ok=dm.sv_int.get('QMAXSIGN', 10) <= 5,
+            qsys_authority_restricted=not (all_auth & grants['qsys']).any(),
+            privileged_access_restricted=not (all_auth & grants['privileged']).any(),
+            all_authority_restricted=not all_auth.any(),
+            users_no_pwd=user_lists['no_pwd'],
+            disabled_users=user_lists['disabled'],
+            users_no_pwd_or_disabled=user_lists['no_pwd_or_disabled'],
+            non_compliant_users=user_lists['non_compliant'],
+            all_authority_preview=", ".join(
+                f"{grants['users'][row]} on {grants['objects'][row]}" for row in preview_rows
+            ),
+            object_authorities=dm.object_authorities,
+            joined={}
+        )
+
+def _joined(facts: NamedTuple, field: str) -> str:
+    """Comma-separated form of one of the facts' user lists, built on first use and shared by all controls"""
+    joined = facts.joined.get(field)
+    if joined is None:
+        joined = facts.joined[field] = ", ".join(getattr(facts, field))
+    return joined
+
+class _ControlStatus(IntEnum):
+    """Control outcome; the member name is the status string stored on the control"""
+    FAIL = 0
+    PASS = 1
+
+def _register_evaluator(registry: Dict[str, Callable], control_id: str) -> Callable[[Callable], Callable]:
+    """Decorator adding an evaluator to a control id -> evaluator table at import"""
+    def register(evaluator: Callable) -> Callable:
+        registry[control_id] = evaluator
+        return evaluator
+    return register
+
+# Per-control evaluators for analyze_compliance_frameworks. Each takes the
+# run's _ComplianceFacts and returns (status, evidence, remediation);
+# remediation is only recorded on the control when it fails.
+
+# Control id -> evaluator
+_EVALUATORS = {}
+
+@_register_evaluator(_EVALUATORS, 'SOX-003')
+def _eval_sox_003(facts: _ComplianceFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check user account management
+    if not facts.non_compliant_users:
+        return _ControlStatus.PASS, 'All users compliant', ''
+    return (_ControlStatus.FAIL,
+            f'{len(facts.non_compliant_users)} non-compliant users: {_joined(facts, "non_compliant_users")}',
+            f'Fix compliance issues for: {_joined(facts, "non_compliant_users")}')
+
+@_register_evaluator(_EVALUATORS, 'PCI-004')
+def _eval_pci_004(facts: _ComplianceFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check user authentication
+    if not facts.users_no_pwd:
+        return _ControlStatus.PASS, 'All users have passwords set', ''
+    return (_ControlStatus.FAIL,
+            f'Users without passwords: {_joined(facts, "users_no_pwd")}',
+            f'Set passwords for: {_joined(facts, "users_no_pwd")}')
+
+@_register_evaluator(_EVALUATORS, 'HIPAA-001')
+def _eval_hipaa_001(facts: _ComplianceFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check access control
+    if not facts.users_no_pwd_or_disabled:
+        return _ControlStatus.PASS, 'All users have proper access controls', ''
+    return (_ControlStatus.FAIL,
+            f'Access control issues: {_joined(facts, "users_no_pwd_or_disabled")}',
+            f'Fix access controls for: {_joined(facts, "users_no_pwd_or_disabled")}')
+
+@_register_evaluator(_EVALUATORS, 'HIPAA-003')
+def _eval_hipaa_003(facts: _ComplianceFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check person or entity authentication
+    if not facts.users_no_pwd:
+        return _ControlStatus.PASS, 'All users have proper authentication', ''
+    return (_ControlStatus.FAIL,
+            f'Authentication issues: {_joined(facts, "users_no_pwd")}',
+            f'Ensure proper authentication for: {_joined(facts, "users_no_pwd")}')
+
+@_register_evaluator(_EVALUATORS, 'ISO-002')
+def _eval_iso_002(facts: _ComplianceFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check user registration and de-registration
+    if not facts.users_no_pwd_or_disabled:
+        return _ControlStatus.PASS, 'All users properly registered and managed', ''
+    return (_ControlStatus.FAIL,
+            f'Registration issues: {_joined(facts, "users_no_pwd_or_disabled")}',
+            f'Review and fix user registration issues for: {_joined(facts, "users_no_pwd_or_disabled")}')
+
+@_register_evaluator(_EVALUATORS, 'NIST-001')
+def _eval_nist_001(facts: _ComplianceFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check identity management and access control
+    if not facts.users_no_pwd_or_disabled:
+        return _ControlStatus.PASS, 'Proper identity management and access control implemented', ''
+    return (_ControlStatus.FAIL,
+            f'Identity and access control issues: {_joined(facts, "users_no_pwd_or_disabled")}',
+            f'Implement proper identity management and access controls for: {_joined(facts, "users_no_pwd_or_disabled")}')
+
+@_register_evaluator(_EVALUATORS, 'NIST-002')
+def _eval_nist_002(facts: _ComplianceFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check asset inventory
+    total_objects = len(facts.object_authorities)
+    if total_objects > 0:
+        return _ControlStatus.PASS, f'System objects properly inventoried and tracked ({total_objects} objects)', ''
+    return _ControlStatus.FAIL, 'No system objects inventoried', 'Implement proper asset inventory'
+
+@_register_evaluator(_EVALUATORS, 'HITRUST-002')
+def _eval_hitrust_002(facts: _ComplianceFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check account management
+    if not facts.users_no_pwd_or_disabled:
+        return _ControlStatus.PASS, 'Account management procedures implemented', ''
+    return (_ControlStatus.FAIL,
+            f'Account management issues: {_joined(facts, "users_no_pwd_or_disabled")}',
+            f'Implement proper account management procedures for: {_joined(facts, "users_no_pwd_or_disabled")}')
+
+def _rule_evaluator(predicate: str, pass_evidence: str, fail_evidence: str,
+                    remediation: str) -> Callable[[_ComplianceFacts], Tuple[_ControlStatus, str, str]]:
+    """Build an evaluator from a declarative rule; evidence templates are formatted with f=facts"""
+    pass_static = '{' not in pass_evidence
+    fail_static = '{' not in fail_evidence
+    
+    def evaluate(facts: _ComplianceFacts) -> Tuple[_ControlStatus, str, str]:
+        # Evidence without placeholders is returned as-is, skipping the format call
+        if getattr(facts, predicate):
+            return _ControlStatus.PASS, pass_evidence if pass_static else pass_evidence.format(f=facts), ''
+        return _ControlStatus.FAIL, fail_evidence if fail_static else fail_evidence.format(f=facts), remediation
+    return evaluate
+
+# Controls decided by one of the shared fact predicates:
+# (control id, predicate field, pass evidence, fail evidence, remediation)
+_FACT_RULES = (
+    ('SOX-001', 'password_expiry_enabled',
+     'QPWDEXPITV={f.pwd_exp}, QPWDCHGCYC={f.pwd_cycle}', 'QPWDEXPITV={f.pwd_exp}, QPWDCHGCYC={f.pwd_cycle}',
+     'Enable password expiration and change cycle'),
+    ('SOX-002', 'inactivity_monitoring',
+     'QINACTMSGQ={f.inact_msgq}', 'QINACTMSGQ={f.inact_msgq}',
+     'Set QINACTMSGQ to QSYSOPR'),
+    ('SOX-004', 'security_level_ok',
+     'QSECURITY={f.qsecurity}', 'QSECURITY={f.qsecurity}',
+     'Set QSECURITY to 40 or higher'),
+    ('PCI-001', 'password_validation_enabled',
+     'QPWDVLDPGM={f.pwd_val}, QPWDCHGCYC={f.pwd_cycle}', 'QPWDVLDPGM={f.pwd_val}, QPWDCHGCYC={f.pwd_cycle}',
+     'Configure QPWDVLDPGM and enable password change cycle'),
+    ('PCI-002', 'qsys_authority_restricted',
+     'No excessive object authorities found', 'QSECOFR has *ALL authority on system objects',
+     'Review and restrict QSECOFR object authorities'),
+    ('PCI-003', 'max_sign_ok',
+     'QMAXSIGN={f.max_sign}', 'QMAXSIGN={f.max_sign}',
+     'Set QMAXSIGN to 5 or fewer'),
+    ('HIPAA-002', 'inactivity_monitoring',
+     'QINACTMSGQ={f.inact_msgq}', 'QINACTMSGQ={f.inact_msgq}',
+     'Configure inactivity monitoring and audit controls'),
+    ('HIPAA-004', 'security_level_ok',
+     'QSECURITY={f.qsecurity}', 'QSECURITY={f.qsecurity}',
+     'Set QSECURITY to 40 or higher'),
+    ('ISO-001', 'security_level_ok',
+     'QSECURITY={f.qsecurity} with proper access controls', 'QSECURITY={f.qsecurity} - insufficient access controls',
+     'Set QSECURITY to 40 or higher'),
+    ('ISO-003', 'password_validation_enabled',
+     'QPWDVLDPGM={f.pwd_val}, QPWDCHGCYC={f.pwd_cycle}', 'QPWDVLDPGM={f.pwd_val}, QPWDCHGCYC={f.pwd_cycle}',
+     'Implement strong password validation program'),
+    ('ISO-004', 'privileged_access_restricted',
+     'Privileged access properly controlled', 'QSECOFR has excessive *ALL authorities',
+     'Review and restrict privileged access rights'),
+    ('ISO-005', 'all_authority_restricted',
+     'Information access properly restricted', 'Multiple excessive object authorities found',
+     'Implement proper access restrictions'),
+    ('NIST-003', 'all_authority_restricted',
+     'Access control policies properly implemented', 'Access control issues: {f.all_authority_preview}',
+     'Implement comprehensive access control policies'),
+    ('NIST-004', 'inactivity_monitoring',
+     'Continuous monitoring implemented: QINACTMSGQ={f.inact_msgq}', 'QINACTMSGQ={f.inact_msgq} - monitoring not configured',
+     'Implement continuous monitoring capabilities'),
+    ('NIST-005', 'inactivity_monitoring',
+     'Incident response monitoring configured', 'No incident response monitoring configured',
+     'Implement incident response and monitoring'),
+    ('HITRUST-001', 'security_level_ok',
+     'Access control policy implemented: QSECURITY={f.qsecurity}', 'No formal access control policy documented: QSECURITY={f.qsecurity}',
+     'Establish and document access control policy'),
+    ('HITRUST-003', 'all_authority_restricted',
+     'Access control policy enforced for all users', 'Access control not properly enforced: {f.all_authority_preview}',
+     'Enforce access control policy consistently'),
+    ('HITRUST-004', 'all_authority_restricted',
+     'Information flow controls implemented', 'Information flow controls not implemented: {f.all_authority_preview}',
+     'Implement information flow controls'),
+    ('HITRUST-005', 'privileged_access_restricted',
+     'Separation of duties implemented', 'QSECOFR has excessive privileges',
+     'Implement proper separation of duties'),
+    ('HITRUST-006', 'all_authority_restricted',
+     'Least privilege principle implemented', 'Multiple users have excessive privileges: {f.all_authority_preview}',
+     'Implement least privilege principle')
+)
+
+# Fact-rule controls complete the evaluator table
+_EVALUATORS.update((control_id, _rule_evaluator(*rule)) for control_id, *rule in _FACT_RULES)
+
+class _FrameworkAdvice(NamedTuple):
+    """Recommendation wording for one family of framework results"""
+    failed_summary: str  # Formatted with count=number of failed controls
+    failed_steps: Tuple[str, ...]
+    passing: Tuple[str, ...]
+
+_COMPLIANCE_ADVICE = _FrameworkAdvice(
+    failed_summary="Address {count} failed controls",
+    failed_steps=(
+        "Prioritize Critical and High priority controls",
+        "Implement automated compliance monitoring",
+        "Conduct regular compliance audits"
+    ),
+    passing=(
+        "All controls are passing",
+        "Maintain current security posture",
+        "Continue regular compliance monitoring"
+    )
+)
+
+_USER_MGMT_ADVICE = _FrameworkAdvice(
+    failed_summary="Address {count} failed user management controls",
+    failed_steps=(
+        "Prioritize Critical and High priority user management controls",
+        "Implement automated user management monitoring",
+        "Conduct regular user access reviews"
+    ),
+    passing=(
+        "All user management controls are passing",
+        "Maintain current user management practices",
+        "Continue regular user management monitoring"
+    )
+)
+
+def _evaluate_framework(framework: _FrameworkDefinition, facts: NamedTuple,
+                        evaluators: Mapping[str, Callable] = _EVALUATORS,
+                        advice: _FrameworkAdvice = _COMPLIANCE_ADVICE) -> Dict[str, Any]:
+    """Evaluate one framework's controls and build its result dict.
+
+    Reads only the immutable template and the run's facts, so frameworks can
+    be evaluated independently of each other. Only the per-run fields
+    (status, evidence, remediation, score, issues, recommendations) are new;
+    the rest of each control dict comes straight from its definition.
+    """
+    controls = []
+    failed_controls = []
+    remediation_steps = []
+    passed_controls = 0
+    
+    for definition in framework.controls:
+        # Evaluate control based on system data
+        evaluator = evaluators.get(definition.id)
+        if evaluator is None:
+            controls.append(definition._asdict())
+            passed_controls += definition.status == 'PASS'
+            continue
+        status, evidence, remediation = evaluator(facts)
+        passed_controls += status
         
-        return pd.DataFrame(results)
+        # Build each result dict in one go from the definition plus its outcome
+        fields = zip(_ControlDefinition._fields, definition)
+        if status is _ControlStatus.PASS:
+            control = dict(fields, status=status.name, evidence=evidence)
+        else:
+            control = dict(fields, status=status.name, evidence=evidence, remediation=remediation)
+            failed_controls.append(control)
+            if remediation:
+                remediation_steps.append(f"- {definition.id}: {remediation}")
+        controls.append(control)
+    
+    # Calculate compliance score based on controls
+    total_controls = len(controls)
+    compliance_score = passed_controls * 100 // total_controls if total_controls > 0 else 0
+    
+    # Generate recommendations based on failed controls
+    if failed_controls:
+        # Summary and generic steps, then the specific remediation steps collected above
+        recommendations = [
+            advice.failed_summary.format(count=len(failed_controls)),
+            *advice.failed_steps,
+            *remediation_steps
+        ]
+    else:
+        recommendations = list(advice.passing)
+    
+    return {
+        'name': framework.name,
+        'description': framework.description,
+        'controls': controls,
+        'compliance_score': compliance_score,
+        'critical_issues': failed_controls,
+        'recommendations': recommendations
+    }
+
+class _UserManagementFacts(NamedTuple):
+    """User profile data shared by the user management evaluators, read once per run"""
+    user_profiles: Dict[str, Dict[str, Any]]
+    users_no_pwd: List[str]
+    disabled_users: List[str]
+    users_no_pwd_or_disabled: List[str]
+    allobj_users: List[str]  # Users with *ALLOBJ special authority
+    user_ids_unique: bool  # No two ids collide once case and surrounding blanks are ignored
+    emergency_accounts: List[str]  # Ids that look like emergency or admin accounts
+    joined: Dict[str, str]  # Field name -> joined user list, filled by _joined
+
+    @classmethod
+    def from_data_manager(cls, dm: IBMiDataManager) -> '_UserManagementFacts':
+        user_lists = dm.profile_user_lists()
+        profiles = dm.user_profiles
+        # One walk over the ids for both id-based checks.
+        # IBM i profile names are not case sensitive, so normalise before comparing
+        normalized_ids = set()
+        emergency_accounts = []
+        for uid in profiles:
+            normalized_ids.add(uid.strip().upper())
+            lowered = uid.lower()
+            if 'emergency' in lowered or 'admin' in lowered:
+                emergency_accounts.append(uid)
+        return cls(
+            user_profiles=profiles,
+            users_no_pwd=user_lists['no_pwd'],
+            disabled_users=user_lists['disabled'],
+            users_no_pwd_or_disabled=user_lists['no_pwd_or_disabled'],
+            allobj_users=user_lists['allobj'],
+            user_ids_unique=len(normalized_ids) == len(profiles),
+            emergency_accounts=emergency_accounts,
+            joined={}
+        )
+
+# Per-control evaluators for analyze_user_management_compliance, with the
+# same (status, evidence, remediation) contract as the framework evaluators.
+
+# User management control id -> evaluator
+_USER_MGMT_EVALUATORS = {}
+
+@_register_evaluator(_USER_MGMT_EVALUATORS, 'SOX-UM-001')
+def _eval_sox_um_001(facts: _UserManagementFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check user account lifecycle management
+    if len(facts.disabled_users) <= 1:  # Allow for one disabled admin account
+        return _ControlStatus.PASS, 'User accounts properly managed', ''
+    joined = _joined(facts, 'disabled_users')
+    return (_ControlStatus.FAIL,
+            f'Multiple disabled users found: {joined}',
+            f'Review and clean up disabled accounts: {joined}')
+
+@_register_evaluator(_USER_MGMT_EVALUATORS, 'SOX-UM-004')
+def _eval_sox_um_004(facts: _UserManagementFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check user activity monitoring
+    return _ControlStatus.PASS, 'User activity monitoring enabled', ''
+
+@_register_evaluator(_USER_MGMT_EVALUATORS, 'PCI-UM-001')
+def _eval_pci_um_001(facts: _UserManagementFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check unique user identification
+    if facts.user_ids_unique:
+        return _ControlStatus.PASS, f'All {len(facts.user_profiles)} users have unique identifiers', ''
+    return _ControlStatus.FAIL, 'Duplicate user identifiers found', 'Ensure all users have unique identifiers'
+
+@_register_evaluator(_USER_MGMT_EVALUATORS, 'HIPAA-UM-001')
+def _eval_hipaa_um_001(facts: _UserManagementFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check unique user identification
+    if facts.user_ids_unique:
+        return _ControlStatus.PASS, f'All {len(facts.user_profiles)} users have unique identification', ''
+    return _ControlStatus.FAIL, 'Duplicate user identification found', 'Ensure all users have unique identification'
+
+@_register_evaluator(_USER_MGMT_EVALUATORS, 'HIPAA-UM-002')
+def _eval_hipaa_um_002(facts: _UserManagementFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check emergency access procedures
+    if facts.emergency_accounts:
+        return _ControlStatus.PASS, f"Emergency access accounts found: {_joined(facts, 'emergency_accounts')}", ''
+    return (_ControlStatus.FAIL, 'No emergency access procedures documented',
+            'Establish emergency access procedures and accounts')
+
+@_register_evaluator(_USER_MGMT_EVALUATORS, 'HIPAA-UM-003')
+def _eval_hipaa_um_003(facts: _UserManagementFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check automatic logoff
+    return _ControlStatus.FAIL, 'Automatic logoff not configured', 'Implement automatic logoff mechanisms'
+
+@_register_evaluator(_USER_MGMT_EVALUATORS, 'HIPAA-UM-004')
+def _eval_hipaa_um_004(facts: _UserManagementFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check encryption and decryption
+    return _ControlStatus.PASS, 'User authentication encryption enabled', ''
+
+@_register_evaluator(_USER_MGMT_EVALUATORS, 'ISO-UM-001')
+def _eval_iso_um_001(facts: _UserManagementFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check user registration and de-registration
+    formal_process = True  # Assume formal process exists
+    if formal_process:
+        return _ControlStatus.PASS, 'Formal user registration process implemented', ''
+    return (_ControlStatus.FAIL, 'No formal user registration process documented',
+            'Implement formal user registration process')
+
+@_register_evaluator(_USER_MGMT_EVALUATORS, 'ISO-UM-004')
+def _eval_iso_um_004(facts: _UserManagementFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check user access review
+    return _ControlStatus.FAIL, 'No regular access reviews documented', 'Implement regular user access reviews'
+
+@_register_evaluator(_USER_MGMT_EVALUATORS, 'NIST-UM-003')
+def _eval_nist_um_003(facts: _UserManagementFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check user training
+    return _ControlStatus.FAIL, 'No user security training documented', 'Implement user security awareness training'
+
+@_register_evaluator(_USER_MGMT_EVALUATORS, 'NIST-UM-004')
+def _eval_nist_um_004(facts: _UserManagementFacts) -> Tuple[_ControlStatus, str, str]:
+    # Check incident response
+    return _ControlStatus.FAIL, 'No user incident response procedures found', 'Establish user incident response procedures'
+
+def _user_list_evaluator(field: str, pass_evidence: str, fail_evidence: str,
+                         remediation: str) -> Callable[[_UserManagementFacts], Tuple[_ControlStatus, str, str]]:
+    """Build an evaluator that fails when a facts user list is non-empty; {users} is the joined list"""
+    # The passing outcome never depends on the facts, so it is built once per rule
+    passed = (_ControlStatus.PASS, pass_evidence, '')
+    
+    def evaluate(facts: _UserManagementFacts) -> Tuple[_ControlStatus, str, str]:
+        if not getattr(facts, field):
+            return passed
+        joined = _joined(facts, field)
+        return _ControlStatus.FAIL, fail_evidence.format(users=joined), remediation.format(users=joined)
+    return evaluate
+
+# User management controls that fail when one of the shared user lists is non-empty:
+# (control id, user list field, pass evidence, fail evidence, remediation)
+_USER_LIST_RULES = (
+    ('SOX-UM-002', 'users_no_pwd',
+     'All users have passwords set',
+     'Users without passwords: {users}', 'Set passwords for: {users}'),
+    ('SOX-UM-003', 'allobj_users',
+     'No users with excessive privileges found',
+     'Users with excessive privileges: {users}', 'Review and restrict privileges for: {users}'),
+    ('PCI-UM-002', 'users_no_pwd',
+     'Strong authentication implemented for all users',
+     'Users without strong authentication: {users}', 'Implement strong authentication for: {users}'),
+    ('PCI-UM-003', 'users_no_pwd_or_disabled',
+     'Account management properly implemented',
+     'Account management issues: {users}', 'Fix account management for: {users}'),
+    ('PCI-UM-004', 'allobj_users',
+     'Access properly restricted based on job function',
+     'Users with excessive access: {users}', 'Restrict access for: {users}'),
+    ('ISO-UM-002', 'allobj_users',
+     'Privileged access properly managed',
+     'Users with excessive privileges: {users}', 'Implement proper privilege management for: {users}'),
+    ('ISO-UM-003', 'users_no_pwd',
+     'Secure password management implemented',
+     'Weak password management: {users}', 'Implement secure password management for: {users}'),
+    ('NIST-UM-001', 'users_no_pwd_or_disabled',
+     'Identity management properly implemented',
+     'Identity management issues: {users}', 'Implement proper identity management for: {users}'),
+    ('NIST-UM-002', 'allobj_users',
+     'Access control policies implemented',
+     'Access control policy gaps: {users}', 'Implement comprehensive access control policies for: {users}'),
+    ('HITRUST-UM-001', 'users_no_pwd_or_disabled',
+     'Account management procedures implemented',
+     'Account management issues: {users}', 'Implement proper account management procedures for: {users}'),
+    ('HITRUST-UM-002', 'allobj_users',
+     'Access control policy enforced for all users',
+     'Access control not properly enforced: {users}', 'Enforce access control policy for: {users}'),
+    ('HITRUST-UM-003', 'allobj_users',
+     'Separation of duties implemented',
+     'Users with conflicting duties: {users}', 'Implement proper separation of duties for: {users}'),
+    ('HITRUST-UM-004', 'allobj_users',
+     'Least privilege principle implemented',
+     'Users with excessive privileges: {users}', 'Implement least privilege principle for: {users}')
+)
+
+# List rules complete the user management evaluator table
+_USER_MGMT_EVALUATORS.update((control_id, _user_list_evaluator(*rule)) for control_id, *rule in _USER_LIST_RULES)
 
 class IBMiSecurityAuditor:
     """Main auditor class that orchestrates all security analysis"""
     
     def __init__(self):
         self.data_manager = IBMiDataManager()
-        self.object_authority = IBMiObjectAuthority(self.data_manager)
-        self.user_profiles = IBMiUserProfiles(self.data_manager)
-        self.system_values = IBMiSystemValues(self.data_manager)
+        self._version_cache = {}  # name -> (data_manager, version, value), see _cached and get_audit_summary
         
-        # Generate initial data
-        self.data_manager.generate_mock_ibm_i_data()
+        # Initial mock data is generated per section when an analysis needs it
+        self.data_manager.defer_mock_ibm_i_data()
+    
+    @cached_property
+    def object_authority(self) -> IBMiObjectAuthority:
+        self.data_manager.ensure_sections('object_authorities')
+        return IBMiObjectAuthority(self.data_manager)
+    
+    @cached_property
+    def user_profiles(self) -> IBMiUserProfiles:
+        self.data_manager.ensure_sections('user_profiles')
+        return IBMiUserProfiles(self.data_manager)
+    
+    @cached_property
+    def system_values(self) -> IBMiSystemValues:
+        self.data_manager.ensure_sections('system_values')
+        return IBMiSystemValues(self.data_manager)
     
     def analyze_compliance_frameworks(self) -> Dict[str, Dict[str, Any]]:
-        """Analyze compliance against major frameworks with specific controls"""
-        
-        # Define specific compliance controls for each framework
-        compliance_controls = {
-            'SOX': {
-                'name': 'Sarbanes-Oxley Act',
-                'description': 'Financial reporting and corporate governance',
-                'controls': [
-                    {
-                        'id': 'SOX-001',
-                        'title': 'Password Policy Enforcement',
-                        'description': 'System must enforce password policies including expiration and complexity',
-                        'requirement': 'SOX Section 404 - Internal Controls',
-                        'test_method': 'Check QPWDEXPITV and QPWDCHGCYC system values',
-                        'pass_criteria': 'Password expiration enabled and change cycle required',
-                        'status': 'PASS',
-                        'evidence': '',
-                        'remediation': '',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'SOX-002',
-                        'title': 'Access Control Monitoring',
-                        'description': 'System must monitor and log access to financial data',
-                        'requirement': 'SOX Section 404 - Access Controls',
-                        'test_method': 'Check QINACTMSGQ system value for inactivity monitoring',
-                        'pass_criteria': 'Inactivity message queue configured',
-                        'status': 'FAIL',
-                        'evidence': 'QINACTMSGQ set to *NONE',
-                        'remediation': 'Set QINACTMSGQ to QSYSOPR',
-                        'priority': 'Medium'
-                    },
-                    {
-                        'id': 'SOX-003',
-                        'title': 'User Account Management',
-                        'description': 'All user accounts must be properly managed and monitored',
-                        'requirement': 'SOX Section 404 - User Management',
-                        'test_method': 'Review user profiles for compliance status',
-                        'pass_criteria': 'All users have proper passwords and are enabled',
-                        'status': 'FAIL',
-                        'evidence': '3 users with security issues found',
-                        'remediation': 'Fix password and account issues for JOHNDOE, JANESMITH, GUEST',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'SOX-004',
-                        'title': 'System Security Level',
-                        'description': 'System must operate at appropriate security level',
-                        'requirement': 'SOX Section 404 - System Security',
-                        'test_method': 'Check QSECURITY system value',
-                        'pass_criteria': 'QSECURITY set to 40 or higher',
-                        'status': 'PASS',
-                        'evidence': 'QSECURITY set to 40',
-                        'remediation': '',
-                        'priority': 'High'
-                    }
-                ],
-                'compliance_score': 0,
-                'critical_issues': [],
-                'recommendations': []
-            },
-            'PCI DSS': {
-                'name': 'Payment Card Industry Data Security Standard',
-                'description': 'Payment card data security',
-                'controls': [
-                    {
-                        'id': 'PCI-001',
-                        'title': 'Strong Password Requirements',
-                        'description': 'Implement strong password policies for all users',
-                        'requirement': 'PCI DSS Requirement 8.2',
-                        'test_method': 'Check password validation program and expiration settings',
-                        'pass_criteria': 'Password validation program configured and expiration enabled',
-                        'status': 'FAIL',
-                        'evidence': 'QPWDVLDPGM set to *NONE, QPWDCHGCYC set to 0',
-                        'remediation': 'Configure QPWDVLDPGM and enable password change cycle',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'PCI-002',
-                        'title': 'Access Control Implementation',
-                        'description': 'Restrict access to cardholder data based on job function',
-                        'requirement': 'PCI DSS Requirement 7.1',
-                        'test_method': 'Review object authorities for sensitive data files',
-                        'pass_criteria': 'No excessive object authorities on sensitive files',
-                        'status': 'FAIL',
-                        'evidence': 'QSECOFR has *ALL authority on system objects',
-                        'remediation': 'Review and restrict QSECOFR object authorities',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'PCI-003',
-                        'title': 'Failed Login Attempts',
-                        'description': 'Limit repeated access attempts by locking out user IDs',
-                        'requirement': 'PCI DSS Requirement 8.1.6',
-                        'test_method': 'Check QMAXSIGN system value',
-                        'pass_criteria': 'QMAXSIGN set to 5 or fewer attempts',
-                        'status': 'PASS',
-                        'evidence': 'QMAXSIGN set to 5',
-                        'remediation': '',
-                        'priority': 'Medium'
-                    },
-                    {
-                        'id': 'PCI-004',
-                        'title': 'User Authentication',
-                        'description': 'Ensure all users have proper authentication',
-                        'requirement': 'PCI DSS Requirement 8.1',
-                        'test_method': 'Review user profiles for password requirements',
-                        'pass_criteria': 'All users have passwords set',
-                        'status': 'FAIL',
-                        'evidence': 'JOHNDOE and GUEST have no passwords set',
-                        'remediation': 'Set passwords for JOHNDOE and GUEST users',
-                        'priority': 'Critical'
-                    }
-                ],
-                'compliance_score': 0,
-                'critical_issues': [],
-                'recommendations': []
-            },
-            'HIPAA': {
-                'name': 'Health Insurance Portability and Accountability Act',
-                'description': 'Healthcare data privacy and security',
-                'controls': [
-                    {
-                        'id': 'HIPAA-001',
-                        'title': 'Access Control',
-                        'description': 'Implement technical policies and procedures for electronic information systems',
-                        'requirement': 'HIPAA Security Rule 164.312(a)(1)',
-                        'test_method': 'Review user access controls and authentication',
-                        'pass_criteria': 'All users have proper access controls and authentication',
-                        'status': 'FAIL',
-                        'evidence': 'Multiple users with authentication and access control issues',
-                        'remediation': 'Implement proper access controls for all users',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'HIPAA-002',
-                        'title': 'Audit Controls',
-                        'description': 'Implement hardware, software, and/or procedural mechanisms to record and examine access',
-                        'requirement': 'HIPAA Security Rule 164.312(b)',
-                        'test_method': 'Check system values for audit and monitoring capabilities',
-                        'pass_criteria': 'Audit controls and monitoring enabled',
-                        'status': 'FAIL',
-                        'evidence': 'QINACTMSGQ not configured for monitoring',
-                        'remediation': 'Configure inactivity monitoring and audit controls',
-                        'priority': 'Medium'
-                    },
-                    {
-                        'id': 'HIPAA-003',
-                        'title': 'Person or Entity Authentication',
-                        'description': 'Implement procedures to verify that a person or entity seeking access is authorized',
-                        'requirement': 'HIPAA Security Rule 164.312(d)',
-                        'test_method': 'Review user authentication mechanisms',
-                        'pass_criteria': 'All users have proper authentication',
-                        'status': 'FAIL',
-                        'evidence': 'Users without passwords and disabled accounts found',
-                        'remediation': 'Ensure all users have proper authentication',
-                        'priority': 'Critical'
-                    },
-                    {
-                        'id': 'HIPAA-004',
-                        'title': 'Transmission Security',
-                        'description': 'Implement technical security measures to guard against unauthorized access',
-                        'requirement': 'HIPAA Security Rule 164.312(c)(1)',
-                        'test_method': 'Check system security level and access controls',
-                        'pass_criteria': 'System security level appropriate and access controlled',
-                        'status': 'PASS',
-                        'evidence': 'QSECURITY set to 40',
-                        'remediation': '',
-                        'priority': 'Medium'
-                    }
-                ],
-                'compliance_score': 0,
-                'critical_issues': [],
-                'recommendations': []
-            },
-            'ISO 27001': {
-                'name': 'ISO/IEC 27001 Information Security Management',
-                'description': 'International standard for information security management systems',
-                'controls': [
-                    {
-                        'id': 'ISO-001',
-                        'title': 'Access Control Policy',
-                        'description': 'Define and implement access control policy based on business requirements',
-                        'requirement': 'ISO 27001 A.9.1.1',
-                        'test_method': 'Review system security level and access control mechanisms',
-                        'pass_criteria': 'Access control policy implemented and enforced',
-                        'status': 'PASS',
-                        'evidence': 'QSECURITY set to 40 with proper access controls',
-                        'remediation': '',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'ISO-002',
-                        'title': 'User Registration and De-registration',
-                        'description': 'Formal user registration and de-registration process for access to systems',
-                        'requirement': 'ISO 27001 A.9.2.1',
-                        'test_method': 'Review user profile management and status',
-                        'pass_criteria': 'All users properly registered and managed',
-                        'status': 'FAIL',
-                        'evidence': 'GUEST account disabled, JOHNDOE has no password',
-                        'remediation': 'Review and fix user registration issues',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'ISO-003',
-                        'title': 'Password Management System',
-                        'description': 'Implement secure password management system',
-                        'requirement': 'ISO 27001 A.9.3.1',
-                        'test_method': 'Check password policies and validation',
-                        'pass_criteria': 'Strong password policy enforced',
-                        'status': 'FAIL',
-                        'evidence': 'QPWDVLDPGM not configured, weak password settings',
-                        'remediation': 'Implement strong password validation program',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'ISO-004',
-                        'title': 'Privileged Access Rights',
-                        'description': 'Allocation and use of privileged access rights',
-                        'requirement': 'ISO 27001 A.9.2.3',
-                        'test_method': 'Review special authorities and object access',
-                        'pass_criteria': 'Privileged access properly controlled',
-                        'status': 'FAIL',
-                        'evidence': 'QSECOFR has excessive *ALL authorities',
-                        'remediation': 'Review and restrict privileged access rights',
-                        'priority': 'Critical'
-                    },
-                    {
-                        'id': 'ISO-005',
-                        'title': 'Information Access Restriction',
-                        'description': 'Restrict access to information and application system functions',
-                        'requirement': 'ISO 27001 A.9.1.2',
-                        'test_method': 'Review object authorities and access controls',
-                        'pass_criteria': 'Information access properly restricted',
-                        'status': 'FAIL',
-                        'evidence': 'Multiple excessive object authorities found',
-                        'remediation': 'Implement proper access restrictions',
-                        'priority': 'High'
-                    }
-                ],
-                'compliance_score': 0,
-                'critical_issues': [],
-                'recommendations': []
-            },
-            'NIST': {
-                'name': 'NIST Cybersecurity Framework',
-                'description': 'Framework for improving critical infrastructure cybersecurity',
-                'controls': [
-                    {
-                        'id': 'NIST-001',
-                        'title': 'Identity Management and Access Control',
-                        'description': 'Implement identity management and access control capabilities',
-                        'requirement': 'NIST CSF ID.AM-6',
-                        'test_method': 'Review user identity management and access controls',
-                        'pass_criteria': 'Proper identity management and access control implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Multiple identity and access control issues found',
-                        'remediation': 'Implement proper identity management and access controls',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'NIST-002',
-                        'title': 'Asset Inventory',
-                        'description': 'Maintain inventory of authorized and unauthorized devices and software',
-                        'requirement': 'NIST CSF ID.AM-1',
-                        'test_method': 'Review system object inventory and access',
-                        'pass_criteria': 'Complete asset inventory maintained',
-                        'status': 'PASS',
-                        'evidence': 'System objects properly inventoried and tracked',
-                        'remediation': '',
-                        'priority': 'Medium'
-                    },
-                    {
-                        'id': 'NIST-003',
-                        'title': 'Access Control Implementation',
-                        'description': 'Implement access control policies and procedures',
-                        'requirement': 'NIST CSF PR.AC-1',
-                        'test_method': 'Review access control mechanisms and policies',
-                        'pass_criteria': 'Access control policies properly implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Access control policies not fully implemented',
-                        'remediation': 'Implement comprehensive access control policies',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'NIST-004',
-                        'title': 'Continuous Monitoring',
-                        'description': 'Implement continuous monitoring capabilities',
-                        'requirement': 'NIST CSF DE.CM-1',
-                        'test_method': 'Check monitoring and logging capabilities',
-                        'pass_criteria': 'Continuous monitoring implemented',
-                        'status': 'FAIL',
-                        'evidence': 'QINACTMSGQ not configured for monitoring',
-                        'remediation': 'Implement continuous monitoring capabilities',
-                        'priority': 'Medium'
-                    },
-                    {
-                        'id': 'NIST-005',
-                        'title': 'Incident Response',
-                        'description': 'Implement incident response capabilities',
-                        'requirement': 'NIST CSF RS.RP-1',
-                        'test_method': 'Review incident response and monitoring capabilities',
-                        'pass_criteria': 'Incident response capabilities implemented',
-                        'status': 'FAIL',
-                        'evidence': 'No incident response monitoring configured',
-                        'remediation': 'Implement incident response and monitoring',
-                        'priority': 'High'
-                    }
-                ],
-                'compliance_score': 0,
-                'critical_issues': [],
-                'recommendations': []
-            },
-            'HI-TRUST': {
-                'name': 'HITRUST Common Security Framework',
-                'description': 'Comprehensive security framework for healthcare organizations',
-                'controls': [
-                    {
-                        'id': 'HITRUST-001',
-                        'title': 'Access Control Policy and Procedures',
-                        'description': 'Establish, document, and disseminate access control policy',
-                        'requirement': 'HITRUST CSF 01.a',
-                        'test_method': 'Review access control policy implementation',
-                        'pass_criteria': 'Access control policy established and documented',
-                        'status': 'FAIL',
-                        'evidence': 'No formal access control policy documented',
-                        'remediation': 'Establish and document access control policy',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'HITRUST-002',
-                        'title': 'Account Management',
-                        'description': 'Establish and maintain procedures for account management',
-                        'requirement': 'HITRUST CSF 01.b',
-                        'test_method': 'Review user account management procedures',
-                        'pass_criteria': 'Account management procedures implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Account management procedures not properly implemented',
-                        'remediation': 'Implement proper account management procedures',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'HITRUST-003',
-                        'title': 'Access Enforcement',
-                        'description': 'Enforce access control policy for all users',
-                        'requirement': 'HITRUST CSF 01.c',
-                        'test_method': 'Review access enforcement mechanisms',
-                        'pass_criteria': 'Access control policy enforced for all users',
-                        'status': 'FAIL',
-                        'evidence': 'Access control not properly enforced',
-                        'remediation': 'Enforce access control policy consistently',
-                        'priority': 'Critical'
-                    },
-                    {
-                        'id': 'HITRUST-004',
-                        'title': 'Information Flow Enforcement',
-                        'description': 'Enforce information flow control policy',
-                        'requirement': 'HITRUST CSF 01.d',
-                        'test_method': 'Review information flow controls',
-                        'pass_criteria': 'Information flow controls implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Information flow controls not implemented',
-                        'remediation': 'Implement information flow controls',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'HITRUST-005',
-                        'title': 'Separation of Duties',
-                        'description': 'Implement separation of duties for critical functions',
-                        'requirement': 'HITRUST CSF 01.e',
-                        'test_method': 'Review user roles and responsibilities',
-                        'pass_criteria': 'Separation of duties implemented',
-                        'status': 'FAIL',
-                        'evidence': 'QSECOFR has excessive privileges',
-                        'remediation': 'Implement proper separation of duties',
-                        'priority': 'Critical'
-                    },
-                    {
-                        'id': 'HITRUST-006',
-                        'title': 'Least Privilege',
-                        'description': 'Implement least privilege principle for user access',
-                        'requirement': 'HITRUST CSF 01.f',
-                        'test_method': 'Review user privileges and access rights',
-                        'pass_criteria': 'Least privilege principle implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Multiple users have excessive privileges',
-                        'remediation': 'Implement least privilege principle',
-                        'priority': 'High'
-                    }
-                ],
-                'compliance_score': 0,
-                'critical_issues': [],
-                'recommendations': []
-            }
-        }
-        
-        # Evaluate controls based on actual system data
-        for framework_name, framework_data in compliance_controls.items():
-            failed_controls = []
-            
-            for control in framework_data['controls']:
-                # Evaluate control based on system data
-                if framework_name == 'SOX':
-                    if control['id'] == 'SOX-001':
-                        # Check password policy enforcement
-                        pwd_exp = self.data_manager.system_values.get('QPWDEXPITV', {}).get('current', '0')
-                        pwd_cycle = self.data_manager.system_values.get('QPWDCHGCYC', {}).get('current', '0')
-                        if pwd_exp != '0' and pwd_cycle != '0':
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'QPWDEXPITV={pwd_exp}, QPWDCHGCYC={pwd_cycle}'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'QPWDEXPITV={pwd_exp}, QPWDCHGCYC={pwd_cycle}'
-                            control['remediation'] = 'Enable password expiration and change cycle'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'SOX-002':
-                        # Check access control monitoring
-                        inact_msgq = self.data_manager.system_values.get('QINACTMSGQ', {}).get('current', '*NONE')
-                        if inact_msgq != '*NONE':
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'QINACTMSGQ={inact_msgq}'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'QINACTMSGQ={inact_msgq}'
-                            control['remediation'] = 'Set QINACTMSGQ to QSYSOPR'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'SOX-003':
-                        # Check user account management
-                        non_compliant_users = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                             if profile.get('compliance_status') == 'Non-Compliant']
-                        if not non_compliant_users:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'All users compliant'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'{len(non_compliant_users)} non-compliant users: {", ".join(non_compliant_users)}'
-                            control['remediation'] = f'Fix compliance issues for: {", ".join(non_compliant_users)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'SOX-004':
-                        # Check system security level
-                        qsecurity = self.data_manager.system_values.get('QSECURITY', {}).get('current', '0')
-                        if int(qsecurity) >= 40:
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'QSECURITY={qsecurity}'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'QSECURITY={qsecurity}'
-                            control['remediation'] = 'Set QSECURITY to 40 or higher'
-                            failed_controls.append(control)
-                
-                elif framework_name == 'PCI DSS':
-                    if control['id'] == 'PCI-001':
-                        # Check strong password requirements
-                        pwd_val = self.data_manager.system_values.get('QPWDVLDPGM', {}).get('current', '*NONE')
-                        pwd_cycle = self.data_manager.system_values.get('QPWDCHGCYC', {}).get('current', '0')
-                        if pwd_val != '*NONE' and pwd_cycle != '0':
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'QPWDVLDPGM={pwd_val}, QPWDCHGCYC={pwd_cycle}'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'QPWDVLDPGM={pwd_val}, QPWDCHGCYC={pwd_cycle}'
-                            control['remediation'] = 'Configure QPWDVLDPGM and enable password change cycle'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'PCI-002':
-                        # Check access control implementation
-                        excessive_auth = False
-                        for obj_name, authorities in self.data_manager.object_authorities.items():
-                            for user, auth_data in authorities.items():
-                                if auth_data.get('obj_auth') == '*ALL' and obj_name.startswith('QSYS/'):
-                                    excessive_auth = True
-                                    break
-                        if not excessive_auth:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'No excessive object authorities found'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = 'QSECOFR has *ALL authority on system objects'
-                            control['remediation'] = 'Review and restrict QSECOFR object authorities'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'PCI-003':
-                        # Check failed login attempts
-                        max_sign = self.data_manager.system_values.get('QMAXSIGN', {}).get('current', '10')
-                        if int(max_sign) <= 5:
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'QMAXSIGN={max_sign}'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'QMAXSIGN={max_sign}'
-                            control['remediation'] = 'Set QMAXSIGN to 5 or fewer'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'PCI-004':
-                        # Check user authentication
-                        users_no_pwd = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                      if profile.get('pass_none') == '*YES']
-                        if not users_no_pwd:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'All users have passwords set'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Users without passwords: {", ".join(users_no_pwd)}'
-                            control['remediation'] = f'Set passwords for: {", ".join(users_no_pwd)}'
-                            failed_controls.append(control)
-                
-                elif framework_name == 'HIPAA':
-                    if control['id'] == 'HIPAA-001':
-                        # Check access control
-                        access_issues = []
-                        for uid, profile in self.data_manager.user_profiles.items():
-                            if profile.get('pass_none') == '*YES' or profile.get('status') == '*DISABLED':
-                                access_issues.append(uid)
-                        if not access_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'All users have proper access controls'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Access control issues: {", ".join(access_issues)}'
-                            control['remediation'] = f'Fix access controls for: {", ".join(access_issues)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HIPAA-002':
-                        # Check audit controls
-                        inact_msgq = self.data_manager.system_values.get('QINACTMSGQ', {}).get('current', '*NONE')
-                        if inact_msgq != '*NONE':
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'QINACTMSGQ={inact_msgq}'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'QINACTMSGQ={inact_msgq}'
-                            control['remediation'] = 'Configure inactivity monitoring and audit controls'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HIPAA-003':
-                        # Check person or entity authentication
-                        auth_issues = []
-                        for uid, profile in self.data_manager.user_profiles.items():
-                            if profile.get('pass_none') == '*YES':
-                                auth_issues.append(uid)
-                        if not auth_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'All users have proper authentication'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Authentication issues: {", ".join(auth_issues)}'
-                            control['remediation'] = f'Ensure proper authentication for: {", ".join(auth_issues)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HIPAA-004':
-                        # Check transmission security
-                        qsecurity = self.data_manager.system_values.get('QSECURITY', {}).get('current', '0')
-                        if int(qsecurity) >= 40:
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'QSECURITY={qsecurity}'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'QSECURITY={qsecurity}'
-                            control['remediation'] = 'Set QSECURITY to 40 or higher'
-                            failed_controls.append(control)
-                
-                elif framework_name == 'ISO 27001':
-                    if control['id'] == 'ISO-001':
-                        # Check access control policy
-                        qsecurity = self.data_manager.system_values.get('QSECURITY', {}).get('current', '0')
-                        if int(qsecurity) >= 40:
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'QSECURITY={qsecurity} with proper access controls'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'QSECURITY={qsecurity} - insufficient access controls'
-                            control['remediation'] = 'Set QSECURITY to 40 or higher'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'ISO-002':
-                        # Check user registration and de-registration
-                        registration_issues = []
-                        for uid, profile in self.data_manager.user_profiles.items():
-                            if profile.get('status') == '*DISABLED' or profile.get('pass_none') == '*YES':
-                                registration_issues.append(uid)
-                        if not registration_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'All users properly registered and managed'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Registration issues: {", ".join(registration_issues)}'
-                            control['remediation'] = f'Review and fix user registration issues for: {", ".join(registration_issues)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'ISO-003':
-                        # Check password management system
-                        pwd_val = self.data_manager.system_values.get('QPWDVLDPGM', {}).get('current', '*NONE')
-                        pwd_cycle = self.data_manager.system_values.get('QPWDCHGCYC', {}).get('current', '0')
-                        if pwd_val != '*NONE' and pwd_cycle != '0':
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'QPWDVLDPGM={pwd_val}, QPWDCHGCYC={pwd_cycle}'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'QPWDVLDPGM={pwd_val}, QPWDCHGCYC={pwd_cycle}'
-                            control['remediation'] = 'Implement strong password validation program'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'ISO-004':
-                        # Check privileged access rights
-                        excessive_priv = False
-                        for obj_name, authorities in self.data_manager.object_authorities.items():
-                            for user, auth_data in authorities.items():
-                                if auth_data.get('obj_auth') == '*ALL' and user == 'QSECOFR':
-                                    excessive_priv = True
-                                    break
-                        if not excessive_priv:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Privileged access properly controlled'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = 'QSECOFR has excessive *ALL authorities'
-                            control['remediation'] = 'Review and restrict privileged access rights'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'ISO-005':
-                        # Check information access restriction
-                        excessive_auth = False
-                        for obj_name, authorities in self.data_manager.object_authorities.items():
-                            for user, auth_data in authorities.items():
-                                if auth_data.get('obj_auth') == '*ALL':
-                                    excessive_auth = True
-                                    break
-                        if not excessive_auth:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Information access properly restricted'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = 'Multiple excessive object authorities found'
-                            control['remediation'] = 'Implement proper access restrictions'
-                            failed_controls.append(control)
-                
-                elif framework_name == 'NIST':
-                    if control['id'] == 'NIST-001':
-                        # Check identity management and access control
-                        identity_issues = []
-                        for uid, profile in self.data_manager.user_profiles.items():
-                            if profile.get('pass_none') == '*YES' or profile.get('status') == '*DISABLED':
-                                identity_issues.append(uid)
-                        if not identity_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Proper identity management and access control implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Identity and access control issues: {", ".join(identity_issues)}'
-                            control['remediation'] = f'Implement proper identity management and access controls for: {", ".join(identity_issues)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'NIST-002':
-                        # Check asset inventory
-                        total_objects = len(self.data_manager.object_authorities)
-                        if total_objects > 0:
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'System objects properly inventoried and tracked ({total_objects} objects)'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = 'No system objects inventoried'
-                            control['remediation'] = 'Implement proper asset inventory'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'NIST-003':
-                        # Check access control implementation
-                        access_issues = []
-                        for obj_name, authorities in self.data_manager.object_authorities.items():
-                            for user, auth_data in authorities.items():
-                                if auth_data.get('obj_auth') == '*ALL':
-                                    access_issues.append(f'{user} on {obj_name}')
-                        if not access_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Access control policies properly implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Access control issues: {", ".join(access_issues[:3])}'
-                            control['remediation'] = 'Implement comprehensive access control policies'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'NIST-004':
-                        # Check continuous monitoring
-                        inact_msgq = self.data_manager.system_values.get('QINACTMSGQ', {}).get('current', '*NONE')
-                        if inact_msgq != '*NONE':
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'Continuous monitoring implemented: QINACTMSGQ={inact_msgq}'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'QINACTMSGQ={inact_msgq} - monitoring not configured'
-                            control['remediation'] = 'Implement continuous monitoring capabilities'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'NIST-005':
-                        # Check incident response
-                        monitoring_configured = self.data_manager.system_values.get('QINACTMSGQ', {}).get('current', '*NONE') != '*NONE'
-                        if monitoring_configured:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Incident response monitoring configured'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = 'No incident response monitoring configured'
-                            control['remediation'] = 'Implement incident response and monitoring'
-                            failed_controls.append(control)
-                
-                elif framework_name == 'HI-TRUST':
-                    if control['id'] == 'HITRUST-001':
-                        # Check access control policy and procedures
-                        qsecurity = self.data_manager.system_values.get('QSECURITY', {}).get('current', '0')
-                        if int(qsecurity) >= 40:
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'Access control policy implemented: QSECURITY={qsecurity}'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'No formal access control policy documented: QSECURITY={qsecurity}'
-                            control['remediation'] = 'Establish and document access control policy'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HITRUST-002':
-                        # Check account management
-                        account_issues = []
-                        for uid, profile in self.data_manager.user_profiles.items():
-                            if profile.get('pass_none') == '*YES' or profile.get('status') == '*DISABLED':
-                                account_issues.append(uid)
-                        if not account_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Account management procedures implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Account management issues: {", ".join(account_issues)}'
-                            control['remediation'] = f'Implement proper account management procedures for: {", ".join(account_issues)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HITRUST-003':
-                        # Check access enforcement
-                        enforcement_issues = []
-                        for obj_name, authorities in self.data_manager.object_authorities.items():
-                            for user, auth_data in authorities.items():
-                                if auth_data.get('obj_auth') == '*ALL':
-                                    enforcement_issues.append(f'{user} on {obj_name}')
-                        if not enforcement_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Access control policy enforced for all users'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Access control not properly enforced: {", ".join(enforcement_issues[:3])}'
-                            control['remediation'] = 'Enforce access control policy consistently'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HITRUST-004':
-                        # Check information flow enforcement
-                        flow_issues = []
-                        for obj_name, authorities in self.data_manager.object_authorities.items():
-                            for user, auth_data in authorities.items():
-                                if auth_data.get('obj_auth') == '*ALL':
-                                    flow_issues.append(f'{user} on {obj_name}')
-                        if not flow_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Information flow controls implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Information flow controls not implemented: {", ".join(flow_issues[:3])}'
-                            control['remediation'] = 'Implement information flow controls'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HITRUST-005':
-                        # Check separation of duties
-                        excessive_priv = False
-                        for obj_name, authorities in self.data_manager.object_authorities.items():
-                            for user, auth_data in authorities.items():
-                                if auth_data.get('obj_auth') == '*ALL' and user == 'QSECOFR':
-                                    excessive_priv = True
-                                    break
-                        if not excessive_priv:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Separation of duties implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = 'QSECOFR has excessive privileges'
-                            control['remediation'] = 'Implement proper separation of duties'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HITRUST-006':
-                        # Check least privilege
-                        privilege_issues = []
-                        for obj_name, authorities in self.data_manager.object_authorities.items():
-                            for user, auth_data in authorities.items():
-                                if auth_data.get('obj_auth') == '*ALL':
-                                    privilege_issues.append(f'{user} on {obj_name}')
-                        if not privilege_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Least privilege principle implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Multiple users have excessive privileges: {", ".join(privilege_issues[:3])}'
-                            control['remediation'] = 'Implement least privilege principle'
-                            failed_controls.append(control)
-            
-            # Calculate compliance score based on controls
-            total_controls = len(framework_data['controls'])
-            passed_controls = len([c for c in framework_data['controls'] if c['status'] == 'PASS'])
-            framework_data['compliance_score'] = int((passed_controls / total_controls) * 100) if total_controls > 0 else 0
-            
-            # Generate recommendations based on failed controls
-            if failed_controls:
-                framework_data['recommendations'] = [
-                    f"Address {len(failed_controls)} failed controls",
-                    "Prioritize Critical and High priority controls",
-                    "Implement automated compliance monitoring",
-                    "Conduct regular compliance audits"
-                ]
-                # Add specific remediation steps
-                for control in failed_controls:
-                    if control['remediation']:
-                        framework_data['recommendations'].append(f"- {control['id']}: {control['remediation']}")
-            else:
-                framework_data['recommendations'] = [
-                    "All controls are passing",
-                    "Maintain current security posture",
-                    "Continue regular compliance monitoring"
-                ]
-            
-            # Add failed controls to critical issues
-            framework_data['critical_issues'] = failed_controls
+        """Analyze compliance against major frameworks with specific controls.
+
+        Results are cached against the data manager's version, so repeated
+        calls on unchanged data return the same (shared) result dict.
+        """
+        self.data_manager.ensure_sections('system_values', 'user_profiles', 'object_authorities')
+        return self._cached('compliance_frameworks', lambda: dict(self.stream_compliance_frameworks()))
+    
+    def stream_compliance_frameworks(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (framework name, result) pairs, evaluating one framework at a time.
+
+        Lets a caller render or export frameworks as they are produced; it
+        bypasses the result cache used by analyze_compliance_frameworks.
+        """
+        dm = self.data_manager
+        dm.ensure_sections('system_values', 'user_profiles', 'object_authorities')
         
-        return compliance_controls
+        # Evaluate each framework's controls against the current system data
+        facts = self._compliance_facts()
+        for framework_name, framework in _COMPLIANCE_CONTROLS_TEMPLATE.items():
+            yield framework_name, _evaluate_framework(framework, facts)
+    
+    def _cached(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return build()'s value for the current data, reused until the data manager or its version changes"""
+        dm = self.data_manager
+        entry = self._version_cache.get(name)
+        if entry is None or entry[0] is not dm or entry[1] != dm.version:
+            entry = self._version_cache[name] = (dm, dm.version, build())
+        return entry[2]
+    
+    def _compliance_facts(self) -> _ComplianceFacts:
+        """Facts derived from the current data, reused until the data manager's version changes"""
+        return self._cached('compliance_facts', lambda: _ComplianceFacts.from_data_manager(self.data_manager))
     
     def analyze_user_management_compliance(self) -> Dict[str, Dict[str, Any]]:
-        """Analyze user management compliance against major frameworks with user-specific controls"""
-        
-        # Define user management specific compliance controls for each framework
-        user_management_controls = {
-            'SOX': {
-                'name': 'Sarbanes-Oxley Act - User Management',
-                'description': 'User management controls for financial reporting compliance',
-                'controls': [
-                    {
-                        'id': 'SOX-UM-001',
-                        'title': 'User Account Lifecycle Management',
-                        'description': 'Proper user account creation, modification, and termination processes',
-                        'requirement': 'SOX Section 404 - User Management Controls',
-                        'test_method': 'Review user profile status and management procedures',
-                        'pass_criteria': 'All user accounts properly managed and documented',
-                        'status': 'PASS',
-                        'evidence': '',
-                        'remediation': '',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'SOX-UM-002',
-                        'title': 'Password Policy Enforcement',
-                        'description': 'Strong password policies enforced for all users',
-                        'requirement': 'SOX Section 404 - Authentication Controls',
-                        'test_method': 'Check user password settings and policies',
-                        'pass_criteria': 'All users have passwords and password policies enforced',
-                        'status': 'FAIL',
-                        'evidence': 'Multiple users without passwords found',
-                        'remediation': 'Enforce password requirements for all users',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'SOX-UM-003',
-                        'title': 'User Access Review',
-                        'description': 'Regular review of user access and privileges',
-                        'requirement': 'SOX Section 404 - Access Control Monitoring',
-                        'test_method': 'Review user special authorities and access rights',
-                        'pass_criteria': 'User access regularly reviewed and documented',
-                        'status': 'FAIL',
-                        'evidence': 'Users with excessive privileges found',
-                        'remediation': 'Implement regular user access reviews',
-                        'priority': 'Medium'
-                    },
-                    {
-                        'id': 'SOX-UM-004',
-                        'title': 'User Activity Monitoring',
-                        'description': 'Monitor and log user activities for audit purposes',
-                        'requirement': 'SOX Section 404 - Audit Controls',
-                        'test_method': 'Check user activity logging and monitoring',
-                        'pass_criteria': 'User activities properly monitored and logged',
-                        'status': 'PASS',
-                        'evidence': 'User activity monitoring enabled',
-                        'remediation': '',
-                        'priority': 'Medium'
-                    }
-                ],
-                'compliance_score': 0,
-                'critical_issues': [],
-                'recommendations': []
-            },
-            'PCI DSS': {
-                'name': 'Payment Card Industry Data Security Standard - User Management',
-                'description': 'User management controls for payment card data security',
-                'controls': [
-                    {
-                        'id': 'PCI-UM-001',
-                        'title': 'Unique User Identification',
-                        'description': 'Each user must have a unique identifier',
-                        'requirement': 'PCI DSS Requirement 8.1',
-                        'test_method': 'Review user profile uniqueness and identification',
-                        'pass_criteria': 'All users have unique identifiers',
-                        'status': 'PASS',
-                        'evidence': 'All users have unique user IDs',
-                        'remediation': '',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'PCI-UM-002',
-                        'title': 'Strong Authentication',
-                        'description': 'Implement strong authentication mechanisms',
-                        'requirement': 'PCI DSS Requirement 8.2',
-                        'test_method': 'Check user password strength and authentication',
-                        'pass_criteria': 'Strong authentication implemented for all users',
-                        'status': 'FAIL',
-                        'evidence': 'Users without passwords and weak authentication found',
-                        'remediation': 'Implement strong authentication for all users',
-                        'priority': 'Critical'
-                    },
-                    {
-                        'id': 'PCI-UM-003',
-                        'title': 'Account Management',
-                        'description': 'Proper account management and lifecycle controls',
-                        'requirement': 'PCI DSS Requirement 8.3',
-                        'test_method': 'Review account management procedures and status',
-                        'pass_criteria': 'Account management properly implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Account management issues found',
-                        'remediation': 'Implement proper account management procedures',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'PCI-UM-004',
-                        'title': 'Access Control',
-                        'description': 'Restrict access based on job function',
-                        'requirement': 'PCI DSS Requirement 7.1',
-                        'test_method': 'Review user access rights and job functions',
-                        'pass_criteria': 'Access restricted based on job function',
-                        'status': 'FAIL',
-                        'evidence': 'Users with excessive access rights found',
-                        'remediation': 'Restrict user access based on job function',
-                        'priority': 'High'
-                    }
-                ],
-                'compliance_score': 0,
-                'critical_issues': [],
-                'recommendations': []
-            },
-            'HIPAA': {
-                'name': 'Health Insurance Portability and Accountability Act - User Management',
-                'description': 'User management controls for healthcare data privacy',
-                'controls': [
-                    {
-                        'id': 'HIPAA-UM-001',
-                        'title': 'Unique User Identification',
-                        'description': 'Assign unique user identification for each user',
-                        'requirement': 'HIPAA Security Rule 164.312(a)(2)(i)',
-                        'test_method': 'Review user identification and uniqueness',
-                        'pass_criteria': 'All users have unique identification',
-                        'status': 'PASS',
-                        'evidence': 'All users have unique user IDs',
-                        'remediation': '',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'HIPAA-UM-002',
-                        'title': 'Emergency Access Procedures',
-                        'description': 'Establish emergency access procedures',
-                        'requirement': 'HIPAA Security Rule 164.312(a)(2)(ii)',
-                        'test_method': 'Review emergency access procedures and accounts',
-                        'pass_criteria': 'Emergency access procedures established',
-                        'status': 'FAIL',
-                        'evidence': 'No emergency access procedures documented',
-                        'remediation': 'Establish emergency access procedures',
-                        'priority': 'Medium'
-                    },
-                    {
-                        'id': 'HIPAA-UM-003',
-                        'title': 'Automatic Logoff',
-                        'description': 'Implement automatic logoff mechanisms',
-                        'requirement': 'HIPAA Security Rule 164.312(a)(2)(iii)',
-                        'test_method': 'Check automatic logoff settings and procedures',
-                        'pass_criteria': 'Automatic logoff implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Automatic logoff not configured',
-                        'remediation': 'Implement automatic logoff mechanisms',
-                        'priority': 'Medium'
-                    },
-                    {
-                        'id': 'HIPAA-UM-004',
-                        'title': 'Encryption and Decryption',
-                        'description': 'Implement encryption for user authentication',
-                        'requirement': 'HIPAA Security Rule 164.312(c)(2)',
-                        'test_method': 'Review user authentication encryption',
-                        'pass_criteria': 'User authentication properly encrypted',
-                        'status': 'PASS',
-                        'evidence': 'User authentication encryption enabled',
-                        'remediation': '',
-                        'priority': 'High'
-                    }
-                ],
-                'compliance_score': 0,
-                'critical_issues': [],
-                'recommendations': []
-            },
-            'ISO 27001': {
-                'name': 'ISO/IEC 27001 Information Security Management - User Management',
-                'description': 'User management controls for information security',
-                'controls': [
-                    {
-                        'id': 'ISO-UM-001',
-                        'title': 'User Registration and De-registration',
-                        'description': 'Formal user registration and de-registration process',
-                        'requirement': 'ISO 27001 A.9.2.1',
-                        'test_method': 'Review user registration and de-registration procedures',
-                        'pass_criteria': 'Formal user registration process implemented',
-                        'status': 'FAIL',
-                        'evidence': 'No formal user registration process documented',
-                        'remediation': 'Implement formal user registration process',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'ISO-UM-002',
-                        'title': 'Privilege Management',
-                        'description': 'Allocation and use of privileged access rights',
-                        'requirement': 'ISO 27001 A.9.2.3',
-                        'test_method': 'Review user privilege allocation and management',
-                        'pass_criteria': 'Privileged access properly managed',
-                        'status': 'FAIL',
-                        'evidence': 'Users with excessive privileges found',
-                        'remediation': 'Implement proper privilege management',
-                        'priority': 'Critical'
-                    },
-                    {
-                        'id': 'ISO-UM-003',
-                        'title': 'Password Management',
-                        'description': 'Secure password management system',
-                        'requirement': 'ISO 27001 A.9.3.1',
-                        'test_method': 'Review password management and policies',
-                        'pass_criteria': 'Secure password management implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Weak password management found',
-                        'remediation': 'Implement secure password management',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'ISO-UM-004',
-                        'title': 'User Access Review',
-                        'description': 'Regular review of user access rights',
-                        'requirement': 'ISO 27001 A.9.2.5',
-                        'test_method': 'Review user access review procedures',
-                        'pass_criteria': 'Regular user access reviews conducted',
-                        'status': 'FAIL',
-                        'evidence': 'No regular access reviews documented',
-                        'remediation': 'Implement regular user access reviews',
-                        'priority': 'Medium'
-                    }
-                ],
-                'compliance_score': 0,
-                'critical_issues': [],
-                'recommendations': []
-            },
-            'NIST': {
-                'name': 'NIST Cybersecurity Framework - User Management',
-                'description': 'User management controls for cybersecurity framework',
-                'controls': [
-                    {
-                        'id': 'NIST-UM-001',
-                        'title': 'Identity Management',
-                        'description': 'Implement identity management capabilities',
-                        'requirement': 'NIST CSF ID.AM-6',
-                        'test_method': 'Review identity management implementation',
-                        'pass_criteria': 'Identity management properly implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Identity management issues found',
-                        'remediation': 'Implement proper identity management',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'NIST-UM-002',
-                        'title': 'Access Control',
-                        'description': 'Implement access control policies',
-                        'requirement': 'NIST CSF PR.AC-1',
-                        'test_method': 'Review access control implementation',
-                        'pass_criteria': 'Access control policies implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Access control policy gaps found',
-                        'remediation': 'Implement comprehensive access control policies',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'NIST-UM-003',
-                        'title': 'User Training',
-                        'description': 'Provide user security awareness training',
-                        'requirement': 'NIST CSF PR.AT-1',
-                        'test_method': 'Review user training and awareness programs',
-                        'pass_criteria': 'User security training provided',
-                        'status': 'FAIL',
-                        'evidence': 'No user security training documented',
-                        'remediation': 'Implement user security awareness training',
-                        'priority': 'Medium'
-                    },
-                    {
-                        'id': 'NIST-UM-004',
-                        'title': 'Incident Response',
-                        'description': 'User-related incident response capabilities',
-                        'requirement': 'NIST CSF RS.RP-1',
-                        'test_method': 'Review user incident response procedures',
-                        'pass_criteria': 'User incident response procedures established',
-                        'status': 'FAIL',
-                        'evidence': 'No user incident response procedures found',
-                        'remediation': 'Establish user incident response procedures',
-                        'priority': 'Medium'
-                    }
-                ],
-                'compliance_score': 0,
-                'critical_issues': [],
-                'recommendations': []
-            },
-            'HI-TRUST': {
-                'name': 'HITRUST Common Security Framework - User Management',
-                'description': 'User management controls for healthcare security framework',
-                'controls': [
-                    {
-                        'id': 'HITRUST-UM-001',
-                        'title': 'Account Management',
-                        'description': 'Establish and maintain account management procedures',
-                        'requirement': 'HITRUST CSF 01.b',
-                        'test_method': 'Review account management procedures',
-                        'pass_criteria': 'Account management procedures implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Account management procedures not properly implemented',
-                        'remediation': 'Implement proper account management procedures',
-                        'priority': 'High'
-                    },
-                    {
-                        'id': 'HITRUST-UM-002',
-                        'title': 'Access Enforcement',
-                        'description': 'Enforce access control policy for all users',
-                        'requirement': 'HITRUST CSF 01.c',
-                        'test_method': 'Review access enforcement mechanisms',
-                        'pass_criteria': 'Access control policy enforced for all users',
-                        'status': 'FAIL',
-                        'evidence': 'Access control not properly enforced',
-                        'remediation': 'Enforce access control policy consistently',
-                        'priority': 'Critical'
-                    },
-                    {
-                        'id': 'HITRUST-UM-003',
-                        'title': 'Separation of Duties',
-                        'description': 'Implement separation of duties for user functions',
-                        'requirement': 'HITRUST CSF 01.e',
-                        'test_method': 'Review user role separation and duties',
-                        'pass_criteria': 'Separation of duties implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Users with conflicting duties found',
-                        'remediation': 'Implement proper separation of duties',
-                        'priority': 'Critical'
-                    },
-                    {
-                        'id': 'HITRUST-UM-004',
-                        'title': 'Least Privilege',
-                        'description': 'Implement least privilege principle for user access',
-                        'requirement': 'HITRUST CSF 01.f',
-                        'test_method': 'Review user privileges and access rights',
-                        'pass_criteria': 'Least privilege principle implemented',
-                        'status': 'FAIL',
-                        'evidence': 'Users with excessive privileges found',
-                        'remediation': 'Implement least privilege principle',
-                        'priority': 'High'
-                    }
-                ],
-                'compliance_score': 0,
-                'critical_issues': [],
-                'recommendations': []
-            }
+        """Analyze user management compliance against major frameworks with user-specific controls.
+
+        Like analyze_compliance_frameworks, results are cached against the
+        data manager's version and shared between calls on unchanged data.
+        """
+        self.data_manager.ensure_sections('user_profiles')
+        return self._cached('user_management_compliance', self._evaluate_user_management)
+    
+    def _evaluate_user_management(self) -> Dict[str, Dict[str, Any]]:
+        """Evaluate user management controls based on actual user data"""
+        facts = _UserManagementFacts.from_data_manager(self.data_manager)
+        return {
+            framework_name: _evaluate_framework(framework, facts, _USER_MGMT_EVALUATORS, _USER_MGMT_ADVICE)
+            for framework_name, framework in _USER_MGMT_CONTROLS_TEMPLATE.items()
         }
-        
-        # Evaluate user management controls based on actual user data
-        for framework_name, framework_data in user_management_controls.items():
-            failed_controls = []
-            
-            for control in framework_data['controls']:
-                # Evaluate control based on user management data
-                if framework_name == 'SOX':
-                    if control['id'] == 'SOX-UM-001':
-                        # Check user account lifecycle management
-                        disabled_users = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                        if profile.get('status') == '*DISABLED']
-                        if len(disabled_users) <= 1:  # Allow for one disabled admin account
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'User accounts properly managed'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Multiple disabled users found: {", ".join(disabled_users)}'
-                            control['remediation'] = f'Review and clean up disabled accounts: {", ".join(disabled_users)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'SOX-UM-002':
-                        # Check password policy enforcement
-                        users_no_pwd = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                      if profile.get('pass_none') == '*YES']
-                        if not users_no_pwd:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'All users have passwords set'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Users without passwords: {", ".join(users_no_pwd)}'
-                            control['remediation'] = f'Set passwords for: {", ".join(users_no_pwd)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'SOX-UM-003':
-                        # Check user access review
-                        excessive_priv = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                        if '*ALLOBJ' in profile.get('spec_auth', [])]
-                        if not excessive_priv:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'No users with excessive privileges found'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Users with excessive privileges: {", ".join(excessive_priv)}'
-                            control['remediation'] = f'Review and restrict privileges for: {", ".join(excessive_priv)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'SOX-UM-004':
-                        # Check user activity monitoring
-                        control['status'] = 'PASS'
-                        control['evidence'] = 'User activity monitoring enabled'
-                
-                elif framework_name == 'PCI DSS':
-                    if control['id'] == 'PCI-UM-001':
-                        # Check unique user identification
-                        total_users = len(self.data_manager.user_profiles)
-                        unique_users = len(set(self.data_manager.user_profiles.keys()))
-                        if total_users == unique_users:
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'All {total_users} users have unique identifiers'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Duplicate user identifiers found'
-                            control['remediation'] = 'Ensure all users have unique identifiers'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'PCI-UM-002':
-                        # Check strong authentication
-                        users_no_pwd = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                      if profile.get('pass_none') == '*YES']
-                        if not users_no_pwd:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Strong authentication implemented for all users'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Users without strong authentication: {", ".join(users_no_pwd)}'
-                            control['remediation'] = f'Implement strong authentication for: {", ".join(users_no_pwd)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'PCI-UM-003':
-                        # Check account management
-                        account_issues = []
-                        for uid, profile in self.data_manager.user_profiles.items():
-                            if profile.get('pass_none') == '*YES' or profile.get('status') == '*DISABLED':
-                                account_issues.append(uid)
-                        if not account_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Account management properly implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Account management issues: {", ".join(account_issues)}'
-                            control['remediation'] = f'Fix account management for: {", ".join(account_issues)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'PCI-UM-004':
-                        # Check access control
-                        excessive_access = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                          if '*ALLOBJ' in profile.get('spec_auth', [])]
-                        if not excessive_access:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Access properly restricted based on job function'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Users with excessive access: {", ".join(excessive_access)}'
-                            control['remediation'] = f'Restrict access for: {", ".join(excessive_access)}'
-                            failed_controls.append(control)
-                
-                elif framework_name == 'HIPAA':
-                    if control['id'] == 'HIPAA-UM-001':
-                        # Check unique user identification
-                        total_users = len(self.data_manager.user_profiles)
-                        unique_users = len(set(self.data_manager.user_profiles.keys()))
-                        if total_users == unique_users:
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'All {total_users} users have unique identification'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = 'Duplicate user identification found'
-                            control['remediation'] = 'Ensure all users have unique identification'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HIPAA-UM-002':
-                        # Check emergency access procedures
-                        emergency_accounts = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                            if 'emergency' in uid.lower() or 'admin' in uid.lower()]
-                        if emergency_accounts:
-                            control['status'] = 'PASS'
-                            control['evidence'] = f'Emergency access accounts found: {", ".join(emergency_accounts)}'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = 'No emergency access procedures documented'
-                            control['remediation'] = 'Establish emergency access procedures and accounts'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HIPAA-UM-003':
-                        # Check automatic logoff
-                        control['status'] = 'FAIL'
-                        control['evidence'] = 'Automatic logoff not configured'
-                        control['remediation'] = 'Implement automatic logoff mechanisms'
-                        failed_controls.append(control)
-                    
-                    elif control['id'] == 'HIPAA-UM-004':
-                        # Check encryption and decryption
-                        control['status'] = 'PASS'
-                        control['evidence'] = 'User authentication encryption enabled'
-                
-                elif framework_name == 'ISO 27001':
-                    if control['id'] == 'ISO-UM-001':
-                        # Check user registration and de-registration
-                        formal_process = True  # Assume formal process exists
-                        if formal_process:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Formal user registration process implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = 'No formal user registration process documented'
-                            control['remediation'] = 'Implement formal user registration process'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'ISO-UM-002':
-                        # Check privilege management
-                        excessive_priv = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                        if '*ALLOBJ' in profile.get('spec_auth', [])]
-                        if not excessive_priv:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Privileged access properly managed'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Users with excessive privileges: {", ".join(excessive_priv)}'
-                            control['remediation'] = f'Implement proper privilege management for: {", ".join(excessive_priv)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'ISO-UM-003':
-                        # Check password management
-                        users_no_pwd = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                      if profile.get('pass_none') == '*YES']
-                        if not users_no_pwd:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Secure password management implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Weak password management: {", ".join(users_no_pwd)}'
-                            control['remediation'] = f'Implement secure password management for: {", ".join(users_no_pwd)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'ISO-UM-004':
-                        # Check user access review
-                        control['status'] = 'FAIL'
-                        control['evidence'] = 'No regular access reviews documented'
-                        control['remediation'] = 'Implement regular user access reviews'
-                        failed_controls.append(control)
-                
-                elif framework_name == 'NIST':
-                    if control['id'] == 'NIST-UM-001':
-                        # Check identity management
-                        identity_issues = []
-                        for uid, profile in self.data_manager.user_profiles.items():
-                            if profile.get('pass_none') == '*YES' or profile.get('status') == '*DISABLED':
-                                identity_issues.append(uid)
-                        if not identity_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Identity management properly implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Identity management issues: {", ".join(identity_issues)}'
-                            control['remediation'] = f'Implement proper identity management for: {", ".join(identity_issues)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'NIST-UM-002':
-                        # Check access control
-                        access_issues = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                       if '*ALLOBJ' in profile.get('spec_auth', [])]
-                        if not access_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Access control policies implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Access control policy gaps: {", ".join(access_issues)}'
-                            control['remediation'] = f'Implement comprehensive access control policies for: {", ".join(access_issues)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'NIST-UM-003':
-                        # Check user training
-                        control['status'] = 'FAIL'
-                        control['evidence'] = 'No user security training documented'
-                        control['remediation'] = 'Implement user security awareness training'
-                        failed_controls.append(control)
-                    
-                    elif control['id'] == 'NIST-UM-004':
-                        # Check incident response
-                        control['status'] = 'FAIL'
-                        control['evidence'] = 'No user incident response procedures found'
-                        control['remediation'] = 'Establish user incident response procedures'
-                        failed_controls.append(control)
-                
-                elif framework_name == 'HI-TRUST':
-                    if control['id'] == 'HITRUST-UM-001':
-                        # Check account management
-                        account_issues = []
-                        for uid, profile in self.data_manager.user_profiles.items():
-                            if profile.get('pass_none') == '*YES' or profile.get('status') == '*DISABLED':
-                                account_issues.append(uid)
-                        if not account_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Account management procedures implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Account management issues: {", ".join(account_issues)}'
-                            control['remediation'] = f'Implement proper account management procedures for: {", ".join(account_issues)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HITRUST-UM-002':
-                        # Check access enforcement
-                        enforcement_issues = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                            if '*ALLOBJ' in profile.get('spec_auth', [])]
-                        if not enforcement_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Access control policy enforced for all users'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Access control not properly enforced: {", ".join(enforcement_issues)}'
-                            control['remediation'] = f'Enforce access control policy for: {", ".join(enforcement_issues)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HITRUST-UM-003':
-                        # Check separation of duties
-                        separation_issues = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                           if '*ALLOBJ' in profile.get('spec_auth', [])]
-                        if not separation_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Separation of duties implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Users with conflicting duties: {", ".join(separation_issues)}'
-                            control['remediation'] = f'Implement proper separation of duties for: {", ".join(separation_issues)}'
-                            failed_controls.append(control)
-                    
-                    elif control['id'] == 'HITRUST-UM-004':
-                        # Check least privilege
-                        privilege_issues = [uid for uid, profile in self.data_manager.user_profiles.items() 
-                                          if '*ALLOBJ' in profile.get('spec_auth', [])]
-                        if not privilege_issues:
-                            control['status'] = 'PASS'
-                            control['evidence'] = 'Least privilege principle implemented'
-                        else:
-                            control['status'] = 'FAIL'
-                            control['evidence'] = f'Users with excessive privileges: {", ".join(privilege_issues)}'
-                            control['remediation'] = f'Implement least privilege principle for: {", ".join(privilege_issues)}'
-                            failed_controls.append(control)
-            
-            # Calculate compliance score based on controls
-            total_controls = len(framework_data['controls'])
-            passed_controls = len([c for c in framework_data['controls'] if c['status'] == 'PASS'])
-            framework_data['compliance_score'] = int((passed_controls / total_controls) * 100) if total_controls > 0 else 0
-            
-            # Generate recommendations based on failed controls
-            if failed_controls:
-                framework_data['recommendations'] = [
-                    f"Address {len(failed_controls)} failed user management controls",
-                    "Prioritize Critical and High priority user management controls",
-                    "Implement automated user management monitoring",
-                    "Conduct regular user access reviews"
-                ]
-                # Add specific remediation steps
-                for control in failed_controls:
-                    if control['remediation']:
-                        framework_data['recommendations'].append(f"- {control['id']}: {control['remediation']}")
-            else:
-                framework_data['recommendations'] = [
-                    "All user management controls are passing",
-                    "Maintain current user management practices",
-                    "Continue regular user management monitoring"
-                ]
-            
-            # Add failed controls to critical issues
-            framework_data['critical_issues'] = failed_controls
-        
-        return user_management_controls
     
     def run_full_audit(self) -> Dict[str, pd.DataFrame]:
-        """Run complete security audit and return all results"""
+        """Run complete security audit and return all results.
+
+        The result frames are cached against the data manager's version, so
+        re-running the audit on unchanged data returns the same frames.
+        """
         try:
-            return {
+            return self._cached('full_audit', lambda: {
                 'object_authorities': self.object_authority.analyze_object_authorities(),
                 'user_profiles': self.user_profiles.analyze_user_profiles(),
                 'system_values': self.system_values.analyze_system_values()
-            }
+            })
         except Exception as e:
             logger.error(f"Error running full audit: {e}")
             # Return empty DataFrames with proper structure
-            return {
-                'object_authorities': pd.DataFrame(columns=['object', 'user', 'object_type', 'security_issues', 'risk_level']),
-                'user_profiles': pd.DataFrame(columns=['user_id', 'name', 'status', 'group', 'special_authorities', 'security_issues', 'risk_level']),
-                'system_values': pd.DataFrame(columns=['system_value', 'current_value', 'recommended_value', 'description', 'compliance_status', 'risk_level'])
-            }
+            return dict(_EMPTY_AUDIT_RESULTS)
     
     def get_audit_summary(self, audit_results: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
-        """Generate audit summary with key metrics"""
+        """Generate audit summary with key metrics.
+
+        The summary is cached against the data manager's version and the
+        result frames it was built from, so Streamlit reruns that pass the
+        same audit results get the same (shared) summary dict back.
+        """
+        dm = self.data_manager
+        frames = tuple(audit_results.items())
+        entry = self._version_cache.get('audit_summary')
+        if (entry is not None and entry[0] is dm and entry[1] == dm.version and len(entry[2]) == len(frames)
+                and all(name == cached_name and df is cached_df
+                        for (name, df), (cached_name, cached_df) in zip(frames, entry[2]))):
+            return entry[3]
+        summary = self._summarize_audit(audit_results)
+        # The cached frames are held by the entry, so their identities stay valid
+        self._version_cache['audit_summary'] = (dm, dm.version, frames, summary)
+        return summary
+    
+    def _summarize_audit(self, audit_results: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+        """Build the get_audit_summary dict from the audit results"""
+        if not audit_results:
+            return _empty_summary()
+        self.data_manager.ensure_sections('system_values', 'user_profiles', 'object_authorities')
+        
         try:
-            summary = {
-                'total_issues': 0,
-                'high_risk_issues': 0,
-                'medium_risk_issues': 0,
-                'low_risk_issues': 0,
-                'compliance_score': 0,
-                'total_objects_analyzed': 0,
-                'categories': {}
-            }
-            
+            # Categorical risk levels (see _categorize_results) are counted from their codes;
+            # any others are stacked so they are counted in one groupby
+            category_counts = {}
+            risk_columns = {}
             for category, df in audit_results.items():
-                if not df.empty and 'risk_level' in df.columns:
-                    category_issues = len(df)
-                    high_risk = len(df[df['risk_level'] == 'High'])
-                    medium_risk = len(df[df['risk_level'] == 'Medium'])
-                    low_risk = len(df[df['risk_level'] == 'Low'])
-                    
-                    summary['total_issues'] += category_issues
-                    summary['high_risk_issues'] += high_risk
-                    summary['medium_risk_issues'] += medium_risk
-                    summary['low_risk_issues'] += low_risk
-                    
-                    summary['categories'][category] = {
-                        'total': category_issues,
-                        'high_risk': high_risk,
-                        'medium_risk': medium_risk,
-                        'low_risk': low_risk
+                if df.empty or 'risk_level' not in df.columns:
+                    continue
+                risk_level = df['risk_level']
+                if isinstance(risk_level.dtype, pd.CategoricalDtype) and list(risk_level.cat.categories) == _RISK_LEVELS:
+                    codes = risk_level.cat.codes.to_numpy()
+                    category_counts[category] = {
+                        'total': len(df),
+                        **dict(zip(_RISK_LEVELS, np.bincount(codes[codes >= 0], minlength=len(_RISK_LEVELS)).tolist()))
                     }
-            
-            # Calculate total objects analyzed
-            summary['total_objects_analyzed'] = len(self.data_manager.system_values) + len(self.data_manager.user_profiles) + len(self.data_manager.object_authorities)
-            summary['total_users_analyzed'] = len(self.data_manager.user_profiles)
-            summary['total_system_values'] = len(self.data_manager.system_values)
-            
-            # Calculate compliance score
-            total_possible_issues = summary['total_objects_analyzed']
-            if total_possible_issues > 0:
-                summary['compliance_score'] = max(0, 100 - (summary['total_issues'] / total_possible_issues * 100))
-            
-            return summary
-        except Exception as e:
+                else:
+                    category_counts[category] = None  # Placeholder keeping the category order
+                    risk_columns[category] = risk_level
+            if risk_columns:
+                by_category = pd.concat(risk_columns, names=['category', None]).groupby(level='category', sort=False)
+                totals = by_category.size()
+                # Categories whose risk levels are all missing still get a (zero) row
+                counts = by_category.value_counts().unstack(fill_value=0).reindex(totals.index, fill_value=0)
+                for category, size in totals.items():
+                    level_counts = counts.loc[category]
+                    category_counts[category] = {
+                        'total': int(size),
+                        **{level: int(level_counts.get(level, 0)) for level in _RISK_LEVELS}
+                    }
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            # Malformed result frames; report an empty summary as before
             logger.error(f"Error generating audit summary: {e}")
-            return {
-                'total_issues': 0,
-                'high_risk_issues': 0,
-                'medium_risk_issues': 0,
-                'low_risk_issues': 0,
-                'compliance_score': 100,
-                'total_objects_analyzed': 0,
-                'total_users_analyzed': 0,
-                'total_system_values': 0,
-                'categories': {}
+            return _empty_summary()
+        
+        # Totals are kept in locals and the summary dict is built once at the end
+        categories = {
+            category: {
+                'total': risk_counts['total'],
+                'high_risk': risk_counts['High'],
+                'medium_risk': risk_counts['Medium'],
+                'low_risk': risk_counts['Low']
             }
+            for category, risk_counts in category_counts.items()
+        }
+        total_issues = sum(risk_counts['total'] for risk_counts in category_counts.values())
+        
+        # Calculate total objects analyzed, taking each section's size once
+        dm = self.data_manager
+        total_users = len(dm.user_profiles)
+        total_system_values = len(dm.system_values)
+        total_objects = total_system_values + total_users + len(dm.object_authorities)
+        
+        # Calculate compliance score, rounded down to a whole percent like the framework scores
+        compliance_score = 0
+        if total_objects > 0:
+            issue_percent = -(-total_issues * 100 // total_objects)  # Rounded up
+            compliance_score = 100 - min(100, issue_percent)
+        
+        return {
+            'total_issues': total_issues,
+            'high_risk_issues': sum(risk_counts['High'] for risk_counts in category_counts.values()),
+            'medium_risk_issues': sum(risk_counts['Medium'] for risk_counts in category_counts.values()),
+            'low_risk_issues': sum(risk_counts['Low'] for risk_counts in category_counts.values()),
+            'compliance_score': compliance_score,
+            'total_objects_analyzed': total_objects,
+            'categories': categories,
+            'total_users_analyzed': total_users,
+            'total_system_values': total_system_values
+        }
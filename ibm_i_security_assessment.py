@@ -19,13 +19,13 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import datetime
 from datetime import timedelta
+from collections import deque
+import io
 import json
 import sys
 import os
-import re
 import hashlib
 import secrets
 
@@ -38,6 +38,7 @@ from ibm_i_audit_core import IBMiSecurityAuditor, IBMiDataManager, IBMiObjectAut
 # Security configuration
 SESSION_TIMEOUT_MINUTES = 30
 MAX_LOGIN_ATTEMPTS = 5
+SECURITY_LOG_LIMIT = 1000  # Most recent security events kept in the session
 SECURE_HEADERS = {
     "X-Frame-Options": "DENY",
     "X-Content-Type-Options": "nosniff",
@@ -45,13 +46,99 @@ SECURE_HEADERS = {
     "Strict-Transport-Security": "max-age=31536000; includeSubDomains"
 }
 
+# Characters stripped from user input by validate_input
+SANITIZE_TABLE = str.maketrans('', '', '<>"\'')
+
+# Compliance frameworks in display order (score cards and detail tabs)
+COMPLIANCE_FRAMEWORKS = ('SOX', 'PCI DSS', 'HIPAA', 'ISO 27001', 'NIST', 'HI-TRUST')
+
+# Cell styles for the control status and priority columns; other values get the default
+STATUS_STYLES = {'PASS': 'background-color: #44ff44; color: black; font-weight: bold'}
+STATUS_STYLE_DEFAULT = 'background-color: #ff4444; color: white; font-weight: bold'
+PRIORITY_STYLES = {
+    'Critical': 'background-color: #ff0000; color: white; font-weight: bold',
+    'High': 'background-color: #ff6600; color: white; font-weight: bold',
+    'Medium': 'background-color: #ffaa00; color: black; font-weight: bold'
+}
+PRIORITY_STYLE_DEFAULT = 'background-color: #44ff44; color: black; font-weight: bold'
+
+# Official documentation for each compliance control
+CONTROL_DOC_LINKS = {
+    'SOX-001': 'https://www.sec.gov/about/laws/soa2002.pdf',
+    'SOX-002': 'https://www.sec.gov/about/laws/soa2002.pdf',
+    'SOX-003': 'https://www.sec.gov/about/laws/soa2002.pdf',
+    'SOX-004': 'https://www.sec.gov/about/laws/soa2002.pdf',
+    'PCI-001': 'https://www.pcisecuritystandards.org/document_library',
+    'PCI-002': 'https://www.pcisecuritystandards.org/document_library',
+    'PCI-003': 'https://www.pcisecuritystandards.org/document_library',
+    'PCI-004': 'https://www.pcisecuritystandards.org/document_library',
+    'HIPAA-001': 'https://www.hhs.gov/hipaa/for-professionals/security/',
+    'HIPAA-002': 'https://www.hhs.gov/hipaa/for-professionals/security/',
+    'HIPAA-003': 'https://www.hhs.gov/hipaa/for-professionals/security/',
+    'HIPAA-004': 'https://www.hhs.gov/hipaa/for-professionals/security/',
+    'ISO-001': 'https://www.iso.org/isoiec-27001-information-security.html',
+    'ISO-002': 'https://www.iso.org/isoiec-27001-information-security.html',
+    'ISO-003': 'https://www.iso.org/isoiec-27001-information-security.html',
+    'ISO-004': 'https://www.iso.org/isoiec-27001-information-security.html',
+    'ISO-005': 'https://www.iso.org/isoiec-27001-information-security.html',
+    'NIST-001': 'https://www.nist.gov/cyberframework',
+    'NIST-002': 'https://www.nist.gov/cyberframework',
+    'NIST-003': 'https://www.nist.gov/cyberframework',
+    'NIST-004': 'https://www.nist.gov/cyberframework',
+    'NIST-005': 'https://www.nist.gov/cyberframework',
+    'HITRUST-001': 'https://hitrustalliance.net/csf/',
+    'HITRUST-002': 'https://hitrustalliance.net/csf/',
+    'HITRUST-003': 'https://hitrustalliance.net/csf/',
+    'HITRUST-004': 'https://hitrustalliance.net/csf/',
+    'HITRUST-005': 'https://hitrustalliance.net/csf/',
+    'HITRUST-006': 'https://hitrustalliance.net/csf/'
+}
+
+def _export_default(value):
+    """JSON fallback for export payloads: DataFrames as row records, anything else as text"""
+    if isinstance(value, pd.DataFrame):
+        return value.to_dict(orient='records')
+    return str(value)
+
+def export_json(data):
+    """Serialize an export payload as indented JSON for download"""
+    return json.dumps(data, indent=2, default=_export_default)
+
+@st.cache_data(max_entries=64)
+def compliance_gauge(title, value, threshold, height):
+    """Compliance score gauge, built once per (title, value, threshold, height); each call gets its own copy"""
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = value,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': title},
+        delta = {'reference': 100},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 50], 'color': "lightgray"},
+                {'range': [50, 80], 'color': "yellow"},
+                {'range': [80, 100], 'color': "green"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': threshold
+            }
+        }
+    ))
+    
+    fig.update_layout(height=height)
+    return fig
+
 def validate_input(input_string, max_length=1000):
     """Validate and sanitize user input"""
     if not input_string or len(input_string) > max_length:
         return False, "Input validation failed"
     
     # Remove potentially dangerous characters
-    sanitized = re.sub(r'[<>"\']', '', input_string)
+    sanitized = input_string.translate(SANITIZE_TABLE)
     return True, sanitized
 
 def check_session_timeout():
@@ -69,8 +156,10 @@ def check_session_timeout():
 
 def log_security_event(event_type, details, user_role="Unknown"):
     """Log security events for audit purposes"""
-    if 'security_log' not in st.session_state:
-        st.session_state.security_log = []
+    security_log = st.session_state.get('security_log')
+    if not isinstance(security_log, deque):
+        # Bounded log: appends past the limit drop the oldest entry without copying
+        security_log = st.session_state.security_log = deque(security_log or (), maxlen=SECURITY_LOG_LIMIT)
     
     log_entry = {
         'timestamp': datetime.datetime.now().isoformat(),
@@ -80,11 +169,7 @@ def log_security_event(event_type, details, user_role="Unknown"):
         'session_id': st.session_state.get('session_id', 'unknown')
     }
     
-    st.session_state.security_log.append(log_entry)
-    
-    # Keep only last 1000 entries
-    if len(st.session_state.security_log) > 1000:
-        st.session_state.security_log = st.session_state.security_log[-1000:]
+    security_log.append(log_entry)
 
 def initialize_session_security():
     """Initialize security features for the session"""
@@ -235,6 +320,7 @@ if 'ibm_i_auditor' not in st.session_state:
     st.session_state.ibm_i_auditor = IBMiSecurityAuditor()
     st.session_state.audit_results = None
     st.session_state.audit_summary = None
+    st.session_state.audit_run_id = None
 
 def main():
     """Main application function"""
@@ -253,6 +339,7 @@ def main():
                 with st.spinner("Running comprehensive IBM i Security Audit..."):
                     st.session_state.audit_results = st.session_state.ibm_i_auditor.run_full_audit()
                     st.session_state.audit_summary = st.session_state.ibm_i_auditor.get_audit_summary(st.session_state.audit_results)
+                    st.session_state.audit_run_id = secrets.token_hex(8)
                 st.success("Audit completed successfully!")
             except Exception as e:
                 st.error(f"Audit failed: {str(e)}")
@@ -290,10 +377,10 @@ def main():
                     'timestamp': datetime.datetime.now().isoformat(),
                     'security_level': st.session_state.security_level
                 }
-                export_json = json.dumps(export_data, indent=2, default=str)
+                export_payload = export_json(export_data)
                 st.download_button(
                     label="Download JSON Report",
-                    data=export_json,
+                    data=export_payload,
                     file_name=f"ibm_i_security_audit_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                     mime="application/json",
                     use_container_width=True
@@ -302,19 +389,26 @@ def main():
             # CSV Export
             if st.button("Export to CSV", key="csv_export", use_container_width=True):
                 # Create comprehensive CSV export
-                csv_data = []
-                for analysis_name, df in st.session_state.audit_results.items():
-                    if isinstance(df, pd.DataFrame) and not df.empty:
-                        df_copy = df.copy()
-                        df_copy['analysis_type'] = analysis_name
-                        csv_data.append(df_copy)
+                csv_data = [
+                    (analysis_name, df) for analysis_name, df in st.session_state.audit_results.items()
+                    if isinstance(df, pd.DataFrame) and not df.empty
+                ]
                 
                 if csv_data:
-                    combined_df = pd.concat(csv_data, ignore_index=True)
-                    csv_export = combined_df.to_csv(index=False)
+                    # Each analysis is written straight into one buffer under a shared header
+                    # (the union of all columns, as a concat would produce) instead of
+                    # concatenating the frames and rendering the whole CSV as one string
+                    csv_columns = list(dict.fromkeys(
+                        column for _, df in csv_data for column in (*df.columns, 'analysis_type')
+                    ))
+                    csv_buffer = io.BytesIO()
+                    for position, (analysis_name, df) in enumerate(csv_data):
+                        df.assign(analysis_type=analysis_name).reindex(columns=csv_columns).to_csv(
+                            csv_buffer, header=position == 0, index=False
+                        )
                     st.download_button(
                         label="Download CSV Report",
-                        data=csv_export,
+                        data=csv_buffer.getvalue(),
                         file_name=f"ibm_i_security_audit_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                         mime="text/csv",
                         use_container_width=True
@@ -323,7 +417,7 @@ def main():
             # Security Log Export
             if st.button("Export Security Log", key="security_log_export", use_container_width=True):
                 if 'security_log' in st.session_state:
-                    security_log_json = json.dumps(st.session_state.security_log, indent=2, default=str)
+                    security_log_json = export_json(list(st.session_state.security_log))
                     st.download_button(
                         label="Download Security Log",
                         data=security_log_json,
@@ -385,10 +479,8 @@ def show_dashboard():
         st.info("Click 'Run Full Security Audit' in the sidebar to begin analysis.")
         return
     
-    # Use caching for expensive computations
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
-    def compute_dashboard_metrics(audit_summary):
-        """Compute dashboard metrics with caching"""
+    def dashboard_metrics(audit_summary):
+        """Compute dashboard metrics from the audit summary"""
         return {
             'compliance_score': audit_summary['compliance_score'],
             'high_risk_issues': audit_summary['high_risk_issues'],
@@ -397,8 +489,19 @@ def show_dashboard():
             'total_objects_analyzed': audit_summary['total_objects_analyzed']
         }
     
-    # Get cached metrics
-    metrics = compute_dashboard_metrics(st.session_state.audit_summary)
+    # Use caching for expensive computations
+    # Keyed on the audit run id, so the summary itself is never hashed
+    @st.cache_data(show_spinner=False, max_entries=64)
+    def compute_dashboard_metrics(audit_run_id, _audit_summary):
+        """Compute dashboard metrics with caching"""
+        return dashboard_metrics(_audit_summary)
+    
+    # Get cached metrics; a summary without a run id is never shared through the cache
+    audit_run_id = st.session_state.get('audit_run_id')
+    if audit_run_id is None:
+        metrics = dashboard_metrics(st.session_state.audit_summary)
+    else:
+        metrics = compute_dashboard_metrics(audit_run_id, st.session_state.audit_summary)
     
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -478,51 +581,31 @@ def show_dashboard():
         # Compliance gauge chart
         compliance_score = st.session_state.audit_summary['compliance_score']
         
-        fig = go.Figure(go.Indicator(
-            mode = "gauge+number+delta",
-            value = compliance_score,
-            domain = {'x': [0, 1], 'y': [0, 1]},
-            title = {'text': "Compliance Score"},
-            delta = {'reference': 100},
-            gauge = {
-                'axis': {'range': [None, 100]},
-                'bar': {'color': "darkblue"},
-                'steps': [
-                    {'range': [0, 50], 'color': "lightgray"},
-                    {'range': [50, 80], 'color': "yellow"},
-                    {'range': [80, 100], 'color': "green"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 90
-                }
-            }
-        ))
-        
-        fig.update_layout(height=400)
+        fig = compliance_gauge("Compliance Score", compliance_score, threshold=90, height=400)
         st.plotly_chart(fig, use_container_width=True)
     
     # Recent security issues
     st.subheader("Recent Security Issues")
     
-    # Get high and medium risk issues from all analyses
+    # Get high and medium risk issues from all analyses, one column-wise frame per analysis
     high_risk_issues = []
     
     for analysis_name, df in st.session_state.audit_results.items():
         if 'risk_level' in df.columns:
-            high_risk = df[df['risk_level'].isin(['High', 'Medium'])]
-            for _, row in high_risk.iterrows():
-                issue = {
+            # Only the columns the table shows are copied for the selected rows
+            shown_columns = df.columns.intersection(['security_issue', 'risk_level', 'recommendation'])
+            high_risk = df.loc[df['risk_level'].isin(['High', 'Medium']), shown_columns]
+            if not high_risk.empty:
+                # Scalars fill the columns an analysis does not provide
+                high_risk_issues.append(pd.DataFrame({
                     'analysis': analysis_name.replace('_', ' ').title(),
-                    'issue': row.get('security_issue', 'Security issue detected'),
-                    'risk_level': row['risk_level'],
-                    'recommendation': row.get('recommendation', 'Review and remediate')
-                }
-                high_risk_issues.append(issue)
+                    'issue': high_risk.get('security_issue', 'Security issue detected'),
+                    'risk_level': high_risk['risk_level'],
+                    'recommendation': high_risk.get('recommendation', 'Review and remediate')
+                }))
     
     if high_risk_issues:
-        df_issues = pd.DataFrame(high_risk_issues)
+        df_issues = pd.concat(high_risk_issues, ignore_index=True)
         st.dataframe(df_issues, use_container_width=True)
     else:
         st.success("No high or medium risk issues detected!")
@@ -546,64 +629,14 @@ def show_compliance_frameworks():
     # Compliance Overview
     st.subheader("Compliance Framework Overview")
     
-    # Create compliance score cards
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        sox_score = compliance_results['SOX']['compliance_score']
-        st.metric(
-            label="SOX Compliance",
-            value=f"{sox_score}%",
+    # Create compliance score cards, three per row
+    for col, framework_name in zip(st.columns(3) + st.columns(3), COMPLIANCE_FRAMEWORKS):
+        score = compliance_results[framework_name]['compliance_score']
+        col.metric(
+            label=f"{framework_name} Compliance",
+            value=f"{score}%",
             delta=None,
-            delta_color="inverse" if sox_score < 80 else "normal"
-        )
-    
-    with col2:
-        pci_score = compliance_results['PCI DSS']['compliance_score']
-        st.metric(
-            label="PCI DSS Compliance",
-            value=f"{pci_score}%",
-            delta=None,
-            delta_color="inverse" if pci_score < 80 else "normal"
-        )
-    
-    with col3:
-        hipaa_score = compliance_results['HIPAA']['compliance_score']
-        st.metric(
-            label="HIPAA Compliance",
-            value=f"{hipaa_score}%",
-            delta=None,
-            delta_color="inverse" if hipaa_score < 80 else "normal"
-        )
-    
-    # Second row of compliance scores
-    col4, col5, col6 = st.columns(3)
-    
-    with col4:
-        iso_score = compliance_results['ISO 27001']['compliance_score']
-        st.metric(
-            label="ISO 27001 Compliance",
-            value=f"{iso_score}%",
-            delta=None,
-            delta_color="inverse" if iso_score < 80 else "normal"
-        )
-    
-    with col5:
-        nist_score = compliance_results['NIST']['compliance_score']
-        st.metric(
-            label="NIST Compliance",
-            value=f"{nist_score}%",
-            delta=None,
-            delta_color="inverse" if nist_score < 80 else "normal"
-        )
-    
-    with col6:
-        hitrust_score = compliance_results['HI-TRUST']['compliance_score']
-        st.metric(
-            label="HI-TRUST Compliance",
-            value=f"{hitrust_score}%",
-            delta=None,
-            delta_color="inverse" if hitrust_score < 80 else "normal"
+            delta_color="inverse" if score < 80 else "normal"
         )
     
     st.markdown("---")
@@ -612,44 +645,26 @@ def show_compliance_frameworks():
     st.subheader("Framework Details")
     
     # Create tabs for each framework
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["SOX", "PCI DSS", "HIPAA", "ISO 27001", "NIST", "HI-TRUST"])
-    
-    with tab1:
-        show_framework_details("SOX", compliance_results['SOX'])
-    
-    with tab2:
-        show_framework_details("PCI DSS", compliance_results['PCI DSS'])
-    
-    with tab3:
-        show_framework_details("HIPAA", compliance_results['HIPAA'])
-    
-    with tab4:
-        show_framework_details("ISO 27001", compliance_results['ISO 27001'])
-    
-    with tab5:
-        show_framework_details("NIST", compliance_results['NIST'])
-    
-    with tab6:
-        show_framework_details("HI-TRUST", compliance_results['HI-TRUST'])
+    for tab, framework_name in zip(st.tabs(list(COMPLIANCE_FRAMEWORKS)), COMPLIANCE_FRAMEWORKS):
+        with tab:
+            show_framework_details(framework_name, compliance_results[framework_name])
     
     # Business Impact Analysis
     st.markdown("---")
     st.subheader("Business Impact Analysis")
     
+    # Collect every framework's critical issues once for the impact and effort counts
+    all_issues = pd.DataFrame(
+        [issue for framework in compliance_results.values() for issue in framework['critical_issues']],
+        columns=['business_impact', 'remediation_effort']
+    )
+    impact_counts = all_issues['business_impact'].value_counts()
+    effort_counts = all_issues['remediation_effort'].value_counts()
+    
     # Calculate business impact metrics
-    high_impact_issues = 0
-    medium_impact_issues = 0
-    low_impact_issues = 0
-    
-    for framework in compliance_results.values():
-        for issue in framework['critical_issues']:
-            impact = issue.get('business_impact', 'Unknown')
-            if impact == 'High':
-                high_impact_issues += 1
-            elif impact == 'Medium':
-                medium_impact_issues += 1
-            elif impact == 'Low':
-                low_impact_issues += 1
+    high_impact_issues = int(impact_counts.get('High', 0))
+    medium_impact_issues = int(impact_counts.get('Medium', 0))
+    low_impact_issues = int(impact_counts.get('Low', 0))
     
     col1, col2, col3 = st.columns(3)
     
@@ -666,19 +681,9 @@ def show_compliance_frameworks():
     st.markdown("---")
     st.subheader("Remediation Effort Analysis")
     
-    high_effort = 0
-    medium_effort = 0
-    low_effort = 0
-    
-    for framework in compliance_results.values():
-        for issue in framework['critical_issues']:
-            effort = issue.get('remediation_effort', 'Unknown')
-            if effort == 'High':
-                high_effort += 1
-            elif effort == 'Medium':
-                medium_effort += 1
-            elif effort == 'Low':
-                low_effort += 1
+    high_effort = int(effort_counts.get('High', 0))
+    medium_effort = int(effort_counts.get('Medium', 0))
+    low_effort = int(effort_counts.get('Low', 0))
     
     col1, col2, col3 = st.columns(3)
     
@@ -712,8 +717,7 @@ def show_compliance_frameworks():
             }
         }
         
-        # Export as JSON
-        json_report = json.dumps(report_data, indent=2)
+        json_report = export_json(report_data)
         st.download_button(
             label="Download Compliance Framework Report (JSON)",
             data=json_report,
@@ -730,29 +734,7 @@ def show_framework_details(framework_name: str, framework_data: dict):
     # Compliance score gauge
     compliance_score = framework_data['compliance_score']
     
-    fig = go.Figure(go.Indicator(
-        mode = "gauge+number+delta",
-        value = compliance_score,
-        domain = {'x': [0, 1], 'y': [0, 1]},
-        title = {'text': f"{framework_name} Compliance Score"},
-        delta = {'reference': 100},
-        gauge = {
-            'axis': {'range': [None, 100]},
-            'bar': {'color': "darkblue"},
-            'steps': [
-                {'range': [0, 50], 'color': "lightgray"},
-                {'range': [50, 80], 'color': "yellow"},
-                {'range': [80, 100], 'color': "green"}
-            ],
-            'threshold': {
-                'line': {'color': "red", 'width': 4},
-                'thickness': 0.75,
-                'value': 80
-            }
-        }
-    ))
-    
-    fig.update_layout(height=300)
+    fig = compliance_gauge(f"{framework_name} Compliance Score", compliance_score, threshold=80, height=300)
     st.plotly_chart(fig, use_container_width=True)
     
     # Compliance Controls
@@ -761,77 +743,31 @@ def show_framework_details(framework_name: str, framework_data: dict):
     if 'controls' in framework_data:
         controls_df = pd.DataFrame(framework_data['controls'])
         
-        # Color code by status and priority
-        def color_status(val):
-            if val == 'PASS':
-                return 'background-color: #44ff44; color: black; font-weight: bold'
-            else:
-                return 'background-color: #ff4444; color: white; font-weight: bold'
-        
-        def color_priority(val):
-            if val == 'Critical':
-                return 'background-color: #ff0000; color: white; font-weight: bold'
-            elif val == 'High':
-                return 'background-color: #ff6600; color: white; font-weight: bold'
-            elif val == 'Medium':
-                return 'background-color: #ffaa00; color: black; font-weight: bold'
-            else:
-                return 'background-color: #44ff44; color: black; font-weight: bold'
-        
         # Select columns to display
         display_columns = ['id', 'title', 'status', 'priority', 'evidence', 'remediation']
         display_df = controls_df[display_columns].copy()
         
-        # Add control links column
-        def get_control_link(control_id):
-            """Get official control documentation link"""
-            links = {
-                'SOX-001': 'https://www.sec.gov/about/laws/soa2002.pdf',
-                'SOX-002': 'https://www.sec.gov/about/laws/soa2002.pdf',
-                'SOX-003': 'https://www.sec.gov/about/laws/soa2002.pdf',
-                'SOX-004': 'https://www.sec.gov/about/laws/soa2002.pdf',
-                'PCI-001': 'https://www.pcisecuritystandards.org/document_library',
-                'PCI-002': 'https://www.pcisecuritystandards.org/document_library',
-                'PCI-003': 'https://www.pcisecuritystandards.org/document_library',
-                'PCI-004': 'https://www.pcisecuritystandards.org/document_library',
-                'HIPAA-001': 'https://www.hhs.gov/hipaa/for-professionals/security/',
-                'HIPAA-002': 'https://www.hhs.gov/hipaa/for-professionals/security/',
-                'HIPAA-003': 'https://www.hhs.gov/hipaa/for-professionals/security/',
-                'HIPAA-004': 'https://www.hhs.gov/hipaa/for-professionals/security/',
-                'ISO-001': 'https://www.iso.org/isoiec-27001-information-security.html',
-                'ISO-002': 'https://www.iso.org/isoiec-27001-information-security.html',
-                'ISO-003': 'https://www.iso.org/isoiec-27001-information-security.html',
-                'ISO-004': 'https://www.iso.org/isoiec-27001-information-security.html',
-                'ISO-005': 'https://www.iso.org/isoiec-27001-information-security.html',
-                'NIST-001': 'https://www.nist.gov/cyberframework',
-                'NIST-002': 'https://www.nist.gov/cyberframework',
-                'NIST-003': 'https://www.nist.gov/cyberframework',
-                'NIST-004': 'https://www.nist.gov/cyberframework',
-                'NIST-005': 'https://www.nist.gov/cyberframework',
-                'HITRUST-001': 'https://hitrustalliance.net/csf/',
-                'HITRUST-002': 'https://hitrustalliance.net/csf/',
-                'HITRUST-003': 'https://hitrustalliance.net/csf/',
-                'HITRUST-004': 'https://hitrustalliance.net/csf/',
-                'HITRUST-005': 'https://hitrustalliance.net/csf/',
-                'HITRUST-006': 'https://hitrustalliance.net/csf/'
-            }
-            return links.get(control_id, '#')
-        
-        # Add control links
-        display_df['control_link'] = display_df['id'].apply(get_control_link)
+        # Add control links (official documentation, '#' when unknown)
+        display_df['control_link'] = display_df['id'].map(CONTROL_DOC_LINKS).fillna('#')
         display_columns.append('control_link')
         
-        # Apply styling
-        styled_controls = display_df.style.map(color_status, subset=['status']).map(color_priority, subset=['priority'])
+        # Color code by status and priority, one dict lookup per column
+        styled_controls = display_df.style.apply(
+            lambda column: column.map(STATUS_STYLES).fillna(STATUS_STYLE_DEFAULT), subset=['status']
+        ).apply(
+            lambda column: column.map(PRIORITY_STYLES).fillna(PRIORITY_STYLE_DEFAULT), subset=['priority']
+        )
         
         # Display with clickable links
         st.markdown("**Note:** Click on control IDs to view official documentation")
         st.dataframe(styled_controls, use_container_width=True)
         
-        # Display clickable links separately for better UX
+        # Display clickable links separately for better UX, as one markdown block
         st.markdown("### Control Documentation Links")
-        for _, control in display_df.iterrows():
-            st.markdown(f"**[{control['id']}]({control['control_link']})** - {control['title']}")
+        st.markdown("\n\n".join(
+            f"**[{control.id}]({control.control_link})** - {control.title}"
+            for control in display_df.itertuples(index=False)
+        ))
         
         # Control summary
         total_controls = len(controls_df)
@@ -906,7 +842,7 @@ def show_object_authorities():
     col1, col2 = st.columns(2)
     
     with col1:
-        risk_counts = filtered_df['risk_level'].value_counts()
+        risk_counts = filtered_df['risk_level'].value_counts()[lambda counts: counts > 0]
         fig = px.bar(
             x=risk_counts.index,
             y=risk_counts.values,
@@ -922,7 +858,7 @@ def show_object_authorities():
     
     with col2:
         # Object types by risk
-        object_risk = filtered_df.groupby(['object_type', 'risk_level']).size().unstack(fill_value=0)
+        object_risk = filtered_df.groupby(['object_type', 'risk_level'], observed=True).size().unstack(fill_value=0)
         fig = px.bar(
             object_risk,
             title="Object Types by Risk Level",
@@ -977,7 +913,7 @@ def show_user_profiles():
     col1, col2 = st.columns(2)
     
     with col1:
-        risk_counts = df_user_profiles['risk_level'].value_counts()
+        risk_counts = df_user_profiles['risk_level'].value_counts()[lambda counts: counts > 0]
         fig = px.pie(
             values=risk_counts.values,
             names=risk_counts.index,
@@ -1067,7 +1003,7 @@ def show_system_values():
     col1, col2 = st.columns(2)
     
     with col1:
-        compliance_counts = df_sysvals['compliance_status'].value_counts()
+        compliance_counts = df_sysvals['compliance_status'].value_counts()[lambda counts: counts > 0]
         fig = px.pie(
             values=compliance_counts.values,
             names=compliance_counts.index,
@@ -1076,7 +1012,7 @@ def show_system_values():
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
-        risk_counts = df_sysvals['risk_level'].value_counts()
+        risk_counts = df_sysvals['risk_level'].value_counts()[lambda counts: counts > 0]
         fig = px.bar(
             x=risk_counts.index,
             y=risk_counts.values,
@@ -1220,7 +1156,7 @@ def show_compliance_report():
             report_data['detailed_results'][analysis_name] = df.to_dict('records')
         
         # Export as JSON
-        json_report = json.dumps(report_data, indent=2)
+        json_report = export_json(report_data)
         st.download_button(
             label="Download Full Report (JSON)",
             data=json_report,
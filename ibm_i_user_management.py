@@ -21,9 +21,9 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import datetime
 from datetime import timedelta
+from collections import deque
 import json
 import sys
 import os
@@ -40,6 +40,7 @@ from ibm_i_audit_core import IBMiSecurityAuditor, IBMiDataManager, IBMiObjectAut
 # Security configuration
 SESSION_TIMEOUT_MINUTES = 30
 MAX_LOGIN_ATTEMPTS = 5
+SECURITY_LOG_LIMIT = 1000  # Most recent security events kept in the session
 SECURE_HEADERS = {
     "X-Frame-Options": "DENY",
     "X-Content-Type-Options": "nosniff",
@@ -47,6 +48,9 @@ SECURE_HEADERS = {
     "Strict-Transport-Security": "max-age=31536000; includeSubDomains"
 }
 
+# Business impact / remediation effort levels counted in the compliance reports
+IMPACT_LEVELS = frozenset({'High', 'Medium', 'Low'})
+
 def validate_input(input_string, max_length=1000):
     """Validate and sanitize user input"""
     if not input_string or len(input_string) > max_length:
@@ -82,8 +86,10 @@ def check_session_timeout():
 
 def log_security_event(event_type, details, user_role="Unknown"):
     """Log security events for audit purposes"""
-    if 'security_log' not in st.session_state:
-        st.session_state.security_log = []
+    security_log = st.session_state.get('security_log')
+    if not isinstance(security_log, deque):
+        # Bounded log: appends past the limit drop the oldest entry without copying
+        security_log = st.session_state.security_log = deque(security_log or (), maxlen=SECURITY_LOG_LIMIT)
     
     log_entry = {
         'timestamp': datetime.datetime.now().isoformat(),
@@ -93,11 +99,7 @@ def log_security_event(event_type, details, user_role="Unknown"):
         'session_id': st.session_state.get('session_id', 'unknown')
     }
     
-    st.session_state.security_log.append(log_entry)
-    
-    # Keep only last 1000 entries
-    if len(st.session_state.security_log) > 1000:
-        st.session_state.security_log = st.session_state.security_log[-1000:]
+    security_log.append(log_entry)
 
 def initialize_session_security():
     """Initialize security features for the session"""
@@ -473,9 +475,10 @@ def main():
         if not st.session_state.is_loading:
             st.markdown("---")
             st.subheader("Quick Stats")
-            total_users = len(st.session_state.ibm_i_data.user_profiles)
-            enabled_users = len([u for u in st.session_state.ibm_i_data.user_profiles.values() if u['status'] == '*ENABLED'])
-            users_with_issues = len([u for u in st.session_state.ibm_i_data.user_profiles.values() if u.get('pass_none') == '*YES'])
+            columns = st.session_state.ibm_i_data.profile_columns()
+            total_users = len(columns['uids'])
+            enabled_users = int(columns['enabled'].sum())
+            users_with_issues = int(columns['pass_none'].sum())
             
             st.metric("Total Users", total_users)
             st.metric("Active Users", enabled_users)
@@ -583,10 +586,12 @@ def show_user_dashboard():
     # Key metrics with enhanced styling
     col1, col2, col3, col4 = st.columns(4)
     
-    total_users = len(st.session_state.ibm_i_data.user_profiles)
-    enabled_users = len([u for u in st.session_state.ibm_i_data.user_profiles.values() if u['status'] == '*ENABLED'])
+    # Counts come from the data manager's cached profile columns
+    columns = st.session_state.ibm_i_data.profile_columns()
+    total_users = len(columns['uids'])
+    enabled_users = int(columns['enabled'].sum())
     disabled_users = total_users - enabled_users
-    users_with_issues = len([u for u in st.session_state.ibm_i_data.user_profiles.values() if u.get('pass_none') == '*YES'])
+    users_with_issues = int(columns['pass_none'].sum())
     
     # Calculate percentages for better insights
     enabled_percentage = (enabled_users / total_users * 100) if total_users > 0 else 0
@@ -856,6 +861,7 @@ def show_user_profiles():
                             'attn_prog': '*NONE',
                             'attn_prog_lib': '*LIBL'
                         }
+                        st.session_state.ibm_i_data.mark_modified()
                         
                         # Add to audit trail
                         add_audit_entry(
@@ -941,6 +947,7 @@ def show_user_profiles():
                             user_profile['group'] = edit_group
                             user_profile['cur_lib'] = edit_lib
                             user_profile['pass_exp'] = edit_exp
+                            st.session_state.ibm_i_data.mark_modified()
                             
                             # Add to audit trail
                             if change_details:
@@ -1117,7 +1124,7 @@ def show_access_control():
             col1, col2 = st.columns(2)
             
             with col1:
-                risk_counts = df_objects['risk_level'].value_counts()
+                risk_counts = df_objects['risk_level'].value_counts()[lambda counts: counts > 0]
                 fig = px.pie(
                     values=risk_counts.values,
                     names=risk_counts.index,
@@ -1289,12 +1296,13 @@ def show_security_policies():
         st.markdown("**Current Password Settings**")
         
         # Get system values for password policy
+        data_manager = st.session_state.ibm_i_data
         password_policies = {
-            'Minimum Length': st.session_state.ibm_i_data.system_values.get('QPWDMINLEN', {}).get('current', '8'),
-            'Maximum Length': st.session_state.ibm_i_data.system_values.get('QPWDMAXLEN', {}).get('current', '128'),
-            'Expiration Interval': st.session_state.ibm_i_data.system_values.get('QPWDEXPITV', {}).get('current', '90'),
-            'Password Level': st.session_state.ibm_i_data.system_values.get('QPWDLVL', {}).get('current', '2'),
-            'Security Level': st.session_state.ibm_i_data.system_values.get('QSECURITY', {}).get('current', '40')
+            'Minimum Length': data_manager.current_value('QPWDMINLEN', '8'),
+            'Maximum Length': data_manager.current_value('QPWDMAXLEN', '128'),
+            'Expiration Interval': data_manager.current_value('QPWDEXPITV', '90'),
+            'Password Level': data_manager.current_value('QPWDLVL', '2'),
+            'Security Level': data_manager.current_value('QSECURITY', '40')
         }
         
         for policy, value in password_policies.items():
@@ -1368,18 +1376,18 @@ def show_security_policies():
 def generate_user_report():
     """Generate comprehensive user report"""
     
-    # Create user report data
+    # Create user report data; the counts come from the cached profile columns
+    columns = st.session_state.ibm_i_data.profile_columns()
     report_data = {
         'timestamp': datetime.datetime.now().isoformat(),
-        'total_users': len(st.session_state.ibm_i_data.user_profiles),
-        'enabled_users': len([u for u in st.session_state.ibm_i_data.user_profiles.values() if u['status'] == '*ENABLED']),
-        'disabled_users': len([u for u in st.session_state.ibm_i_data.user_profiles.values() if u['status'] == '*DISABLED']),
-        'users_with_issues': len([u for u in st.session_state.ibm_i_data.user_profiles.values() if u.get('pass_none') == '*YES']),
+        'total_users': len(columns['uids']),
+        'enabled_users': int(columns['enabled'].sum()),
+        'disabled_users': int(columns['disabled'].sum()),
+        'users_with_issues': int(columns['pass_none'].sum()),
         'user_profiles': st.session_state.ibm_i_data.user_profiles,
         'groups': st.session_state.ibm_i_data.groups
     }
     
-    # Export as JSON
     json_report = json.dumps(report_data, indent=2)
     st.download_button(
         label="Download User Report (JSON)",
@@ -1493,20 +1501,22 @@ def show_compliance_reports():
     st.markdown("---")
     st.subheader("User Management Impact Analysis")
     
-    # Calculate user management impact metrics
-    high_impact_issues = 0
-    medium_impact_issues = 0
-    low_impact_issues = 0
+    # Calculate user management impact and effort metrics in one pass over the issues
+    impact_counts = dict.fromkeys(IMPACT_LEVELS, 0)
+    effort_counts = dict.fromkeys(IMPACT_LEVELS, 0)
     
     for framework in compliance_results.values():
         for issue in framework['critical_issues']:
             impact = issue.get('business_impact', 'Unknown')
-            if impact == 'High':
-                high_impact_issues += 1
-            elif impact == 'Medium':
-                medium_impact_issues += 1
-            elif impact == 'Low':
-                low_impact_issues += 1
+            if impact in IMPACT_LEVELS:
+                impact_counts[impact] += 1
+            effort = issue.get('remediation_effort', 'Unknown')
+            if effort in IMPACT_LEVELS:
+                effort_counts[effort] += 1
+    
+    high_impact_issues = impact_counts['High']
+    medium_impact_issues = impact_counts['Medium']
+    low_impact_issues = impact_counts['Low']
     
     col1, col2, col3 = st.columns(3)
     
@@ -1523,19 +1533,9 @@ def show_compliance_reports():
     st.markdown("---")
     st.subheader("User Management Effort Analysis")
     
-    high_effort = 0
-    medium_effort = 0
-    low_effort = 0
-    
-    for framework in compliance_results.values():
-        for issue in framework['critical_issues']:
-            effort = issue.get('remediation_effort', 'Unknown')
-            if effort == 'High':
-                high_effort += 1
-            elif effort == 'Medium':
-                medium_effort += 1
-            elif effort == 'Low':
-                low_effort += 1
+    high_effort = effort_counts['High']
+    medium_effort = effort_counts['Medium']
+    low_effort = effort_counts['Low']
     
     col1, col2, col3 = st.columns(3)
     
@@ -1569,7 +1569,6 @@ def show_compliance_reports():
             }
         }
         
-        # Export as JSON
         json_report = json.dumps(report_data, indent=2)
         st.download_button(
             label="Download User Management Compliance Report (JSON)",
@@ -1626,12 +1625,13 @@ def show_user_framework_details(framework_name: str, framework_data: dict):
                 return 'background-color: #ff4444; color: white; font-weight: bold'
         
         def color_priority(val):
-            if val == 'Critical':
-                return 'background-color: #ff0000; color: white; font-weight: bold'
-            elif val == 'High':
+            # Ordered by how often each priority occurs in the control templates
+            if val == 'High':
                 return 'background-color: #ff6600; color: white; font-weight: bold'
             elif val == 'Medium':
                 return 'background-color: #ffaa00; color: black; font-weight: bold'
+            elif val == 'Critical':
+                return 'background-color: #ff0000; color: white; font-weight: bold'
             else:
                 return 'background-color: #44ff44; color: black; font-weight: bold'
         